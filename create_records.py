@@ -1,29 +1,43 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import copy
 import csv
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 import io
+import json
 import logging
+import os
+from logging.handlers import QueueHandler, QueueListener
+import queue
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import threading
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Tuple
 
-import configparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import dotenv_values
-import xml.etree.ElementTree as ET
 from lxml import etree
-from pymarc import Record, Field, Subfield, record_to_xml
-from pymarc.marcxml import parse_xml_to_array
-from urllib.parse import quote
+from pymarc import Record, Field, Subfield, Indicators, Leader
+from urllib.parse import quote, urlencode
 from bs4 import BeautifulSoup
 import html
 import time
+from types import MappingProxyType
 
-from almapiwrapper.inventory import Item, IzBib, Holding
+# almapiwrapper (qui charge pandas) est importé dans les fonctions qui
+# appellent Alma : --help et les erreurs d'arguments n'en paient pas le coût.
+if TYPE_CHECKING:
+    from almapiwrapper.inventory import Item, IzBib, Holding
+    from almapiwrapper.record import XmlData
 
 # =============================================================================
 # CONSTANTS PAR DÉFAUT
@@ -37,11 +51,38 @@ LOGGER_NAME = "Get records from Infoscience"
 # Format des dates pour les logs et rapports : YYYY-MM-DD
 TODAY = date.today().isoformat()
 LOG_DIR = "log"
-Path(LOG_DIR).mkdir(parents=True, exist_ok=True)
 INFO_LOG = f"log/create_records_{TODAY}.log"
 ERROR_LOG = f"log/errors_{TODAY}.log"
 REPORT_CSV = f"rapport_{TODAY}.csv"
 REPORT_DIR = "repports"
+# Dernière cote attribuée (mise à jour après chaque attribution)
+LAST_CALL_NUMBER_FILE = "last_call_number.txt"
+# Environnements Alma acceptés (--env)
+ENV_CHOICES = ("S", "P")
+
+# Variables Alma (.env), lues une seule fois à l'import (mapping en lecture seule)
+DOTENV_CONFIG = MappingProxyType(dotenv_values(".env"))
+
+# Colonnes du rapport CSV (voir NoticeReport.to_csv_row)
+REPORT_FIELDNAMES = (
+    "record_index",
+    "infoscience_id",
+    "title",
+    "author",
+    "call_number",
+    "sru_exists",
+    "mms_id",
+    "bib_status",
+    "bib_error",
+    "warnings",
+    "holding_locations",
+    "holding_ids",
+    "holding_statuses",
+    "holding_errors",
+    "item_ids",
+    "item_statuses",
+    "item_errors",
+)
 
 HOLDING_INFO_DEFAULT = {
     "locations": ["E02XA", "E02SP"],
@@ -56,12 +97,131 @@ ITEM_INFO_DEFAULT = {
     "material_type_code": "THESIS",
 }
 
+# Parties statiques des notices MARC, construites une seule fois à l'import.
+# Subfield et Indicators sont des tuples immuables : on peut les partager entre
+# notices, seul un Field neuf (et sa liste de sous-champs) est créé par notice.
+BIB_LEADER = "00000nam a2200000 c 4500"
+BIB_008_TEMPLATE = "||||||s{year}    sz   a   m    00| | eng  "
+HOLDING_LEADER = "00137nx##a2200061zn#4500"
+HOLDING_008_SUFFIX = "2u####8###4001uueng0000000"
+
+BIB_040_SUBFIELDS = (
+    Subfield("a", "CH-ZuSLS EPFL"),
+    Subfield("b", "fre"),
+    Subfield("e", "rda"),
+)
+BIB_RDA_FIELDS = (
+    ("336", (Subfield("b", "txt"), Subfield("2", "rdacontent"))),
+    ("337", (Subfield("b", "n"), Subfield("2", "rdamedia"))),
+    ("338", (Subfield("b", "nc"), Subfield("2", "rdacarrier"))),
+)
+BIB_655_SUBFIELDS = (
+    (
+        Subfield("a", "Thèses et écrits académiques"),
+        Subfield("0", "(IDREF)027253139"),
+        Subfield("2", "idref"),
+    ),
+    (Subfield("a", "Hochschulschrift"), Subfield("2", "gnd-content")),
+    (Subfield("a", "Tesi"), Subfield("2", "sbt12-content")),
+)
+IND_BLANK = Indicators(" ", " ")
+IND_655 = Indicators(" ", "7")
+
+INFOSCIENCE_EXPORT_URL = "https://infoscience.epfl.ch/server/api/discover/export"
+INFOSCIENCE_CONFIGURATION = "researchoutputs"
+INFOSCIENCE_F_TYPES = "thesis-coar-types:c_db06,authority"
+
+MARC_XML_NS = "http://www.loc.gov/MARC21/slim"
+XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+MARC_XML_SCHEMA_LOCATION = f"{MARC_XML_NS} http://www.loc.gov/standards/marcxml/schema/MARC21slim.xsd"
+NS_MARC = {"marc": MARC_XML_NS}
+NS_SRW = {"srw": "http://www.loc.gov/zing/srw/", "marc": MARC_XML_NS}
+
+# XPath compilés une seule fois (réutilisés pour chaque notice)
+XPATH_MARC_RECORD = etree.XPath(".//marc:record", namespaces=NS_MARC)
+XPATH_SUBFIELD_TEXT = etree.XPath(
+    "marc:datafield[@tag=$tag]/marc:subfield[@code=$code]/text()",
+    namespaces=NS_MARC,
+)
+
+# Réponse Analytics : valeur de Column3 dans la première Row (XPath compilé une fois)
+NS_ANALYTICS_ROWSET = "urn:schemas-microsoft-com:xml-analysis:rowset"
+XPATH_ANALYTICS_FIRST_COLUMN3 = etree.XPath(
+    "(.//ns:Row)[1]/ns:Column3/text()",
+    namespaces={"ns": NS_ANALYTICS_ROWSET},
+)
+
+
+# =============================================================================
+# HTTP SESSION
+# =============================================================================
+
+
+def build_http_session() -> requests.Session:
+    """
+    Session HTTP partagée (Analytics, Infoscience, SRU) : connexions keep-alive
+    réutilisées entre les appels et retry avec backoff sur les erreurs transitoires.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        # Après épuisement des retries, on rend la dernière réponse :
+        # les appelants gardent leur propre contrôle du status_code.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+HTTP_SESSION = build_http_session()
+
 
 # =============================================================================
 # LOGGER CONFIGURATION
 # =============================================================================
 
 
+# Logger du module (fonctions utilitaires hors main)
+LOGGER = logging.getLogger(LOGGER_NAME)
+
+# Thread d'écriture des fichiers de log (voir get_logger)
+LOG_LISTENER: Optional[QueueListener] = None
+
+
+class LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler pour une file interne au processus : le message est résolu
+    dans le thread appelant, mais exc_info est conservé pour que les handlers
+    fichiers appliquent leurs propres formatters (traceback dans errors.log).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def stop_log_listener() -> None:
+    """Vide la file de logs, arrête le thread d'écriture et ferme les fichiers."""
+    global LOG_LISTENER
+    if LOG_LISTENER is None:
+        return
+    LOG_LISTENER.stop()
+    for handler in LOG_LISTENER.handlers:
+        handler.close()
+    LOG_LISTENER = None
+
+
+atexit.register(stop_log_listener)
+
+
 class NoTracebackFormatter(logging.Formatter):
     """Formatter qui masque la traceback même si exc_info est présent."""
 
@@ -79,13 +239,21 @@ class NoTracebackFormatter(logging.Formatter):
 
 
 def get_logger(console_level: int = logging.INFO) -> logging.Logger:
-    """Configure et retourne un logger sans duplication de handlers."""
+    """
+    Configure et retourne un logger sans duplication de handlers.
+
+    Les fichiers de log sont écrits par un QueueListener (thread dédié) :
+    le traitement des notices ne bloque pas sur les écritures disque.
+    """
+    global LOG_LISTENER
+
     logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(logging.DEBUG)
     logger.propagate = False
 
     if logger.hasHandlers():
         logger.handlers.clear()
+    stop_log_listener()
 
     # Console (stderr)
     console = logging.StreamHandler(stream=sys.stderr)
@@ -93,6 +261,7 @@ def get_logger(console_level: int = logging.INFO) -> logging.Logger:
     console.setFormatter(NoTracebackFormatter("%(levelname)s - %(message)s"))
 
     # Fichier global (INFO+)
+    Path(LOG_DIR).mkdir(parents=True, exist_ok=True)
     info_fh = logging.FileHandler(INFO_LOG, encoding="utf-8")
     info_fh.setLevel(logging.INFO)
     info_fh.setFormatter(
@@ -106,9 +275,14 @@ def get_logger(console_level: int = logging.INFO) -> logging.Logger:
         logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
     )
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = LocalQueueHandler(log_queue)
+    queue_handler.setLevel(logging.INFO)
+    LOG_LISTENER = QueueListener(log_queue, info_fh, error_fh, respect_handler_level=True)
+    LOG_LISTENER.start()
+
     logger.addHandler(console)
-    logger.addHandler(info_fh)
-    logger.addHandler(error_fh)
+    logger.addHandler(queue_handler)
 
     return logger
 
@@ -183,12 +357,18 @@ def fget(r: Record, tag: str, code: str) -> Optional[str]:
     return f.get(code) if (f and code in f) else None
 
 
-def fget_all(r: Record, tag: str, code: str) -> list[str]:
-    """Retourne toutes les valeurs du sous-champ `code` pour le champ `tag`."""
-    vals: list[str] = []
-    for f in r.get_fields(tag):
-        vals.extend(f.get_subfields(code))
-    return vals
+def index_fields(r: Record) -> Dict[str, List[Field]]:
+    """Indexe les champs d'une notice par tag, en un seul parcours de r.fields."""
+    by_tag: Dict[str, List[Field]] = {}
+    for f in r.fields:
+        by_tag.setdefault(f.tag, []).append(f)
+    return by_tag
+
+
+def fget_indexed(by_tag: Dict[str, List[Field]], tag: str, code: str) -> Optional[str]:
+    """Équivalent de fget() sur un index de champs (voir index_fields)."""
+    fields = by_tag.get(tag)
+    return fields[0].get(code) if fields else None
 
 
 def first(it: Iterable[str]) -> Optional[str]:
@@ -198,50 +378,69 @@ def first(it: Iterable[str]) -> Optional[str]:
     return None
 
 
+EPFL_FULL_NAME = "Ecole Polytechnique Fédérale de Lausanne"
+PAGES_RE = re.compile("pages", re.IGNORECASE)
+
+
 def expand_epfl(v: Optional[str]) -> Optional[str]:
     """Convertit 'EPFL' → 'Ecole Polytechnique Fédérale de Lausanne'."""
     if not v:
         return v
-    return "Ecole Polytechnique Fédérale de Lausanne" if v.strip().upper() == "EPFL" else v
+    s = v.strip()
+    # Test de longueur d'abord : upper() n'est appelé que pour 4 caractères
+    return EPFL_FULL_NAME if len(s) == 4 and s.upper() == "EPFL" else v
 
 
 def invert_name_comma(name: Optional[str]) -> Optional[str]:
     """Inverse 'Nom, Prénom(s)' → 'Prénom(s) Nom'."""
-    if not name:
+    if not name or "," not in name:
         return name
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) >= 2:
-        last = parts[0]
-        firsts = " ".join(parts[1:]).strip()
-        return f"{firsts} {last}".strip()
-    return name
+    last, _, rest = name.partition(",")
+    firsts = " ".join(p.strip() for p in rest.split(",")).strip()
+    return f"{firsts} {last.strip()}".strip()
 
 
 def ensure_pages_suffix(val: Optional[str]) -> Optional[str]:
     """Ajoute ' pages' à la valeur si ce n’est pas déjà présent."""
     if not val:
         return val
-    if "pages" in val.lower():
+    # Recherche insensible à la casse sans créer de copie en minuscules
+    if PAGES_RE.search(val):
         return val
     return f"{val.strip()} pages"
 
 
+def is_buildable(record: Optional[Record]) -> bool:
+    """
+    Pré-contrôle peu coûteux avant build_final_record : la notice source
+    doit contenir au moins un champ.
+    """
+    return record is not None and bool(record.fields)
+
+
 def build_final_record(src: Record) -> Record:
     """
     Construit une notice MARC finale (EPFL) à partir d'une notice source Infoscience.
     """
     dst = Record(force_utf8=True)
 
+    # Un seul parcours des champs source, puis accès direct par tag
+    by_tag = index_fields(src)
+
     # 001 : Identifiant Infoscience
-    cf001 = src["001"].data if src["001"] is not None else None
+    f001 = by_tag.get("001")
+    cf001 = f001[0].data if f001 else None
     if cf001:
         dst.add_field(Field(tag="001", data=cf001))
 
     # LDR / 008 : Champs de contrôle (statiques)
-    dst.leader = "00000nam a2200000 c 4500"
+    dst.leader = BIB_LEADER
     # 008 : type de date + année (YYYY) depuis 260$c (fallback 502$d, puis année courante)
-    year_260 = extract_year(fget(src, "260", "c"))
-    year_502 = extract_year(fget(src, "502", "d"))
+    place_260a = fget_indexed(by_tag, "260", "a")
+    publ_260b = fget_indexed(by_tag, "260", "b")
+    date_260c = fget_indexed(by_tag, "260", "c")
+    year_260 = extract_year(date_260c)
+    year_502 = extract_year(fget_indexed(by_tag, "502", "d"))
 
     fallback_used = False
     if year_260:
@@ -252,31 +451,21 @@ def build_final_record(src: Record) -> Record:
         year = str(date.today().year)
         fallback_used = True
 
-    dst.add_field(Field(tag="008", data=f"||||||s{year}    sz   a   m    00| | eng  "))
+    dst.add_field(Field(tag="008", data=BIB_008_TEMPLATE.format(year=year)))
 
     # 040 : Agence de catalogage (statiques)
-    dst.add_field(
-        Field(
-            tag="040",
-            indicators=[" ", " "],
-            subfields=[
-                Subfield("a", "CH-ZuSLS EPFL"),
-                Subfield("b", "fre"),
-                Subfield("e", "rda"),
-            ],
-        )
-    )
+    dst.add_field(Field(tag="040", indicators=IND_BLANK, subfields=list(BIB_040_SUBFIELDS)))
 
     # 100 1_ : Auteur principal
-    author700a = first(f.get("a") for f in src.get_fields("700") if "a" in f)
+    author700a = first(f.get("a") for f in by_tag.get("700", ()) if "a" in f)
     f100_subs = [Subfield("4", "aut")]
     if author700a:
         f100_subs.insert(0, Subfield("a", author700a))
     dst.add_field(Field(tag="100", indicators=["1", " "], subfields=f100_subs))
 
     # 245 10 : Titre principal
-    t_a = clean_html(fget(src, "245", "a"))
-    t_b = clean_html(fget(src, "245", "b"))
+    t_a = clean_html(fget_indexed(by_tag, "245", "a"))
+    t_b = clean_html(fget_indexed(by_tag, "245", "b"))
     t_c = clean_html(invert_name_comma(author700a))
     subf_245: list[Subfield] = []
     if t_a:
@@ -289,21 +478,19 @@ def build_final_record(src: Record) -> Record:
         dst.add_field(Field(tag="245", indicators=["1", "0"], subfields=subf_245))
 
     # 264 _1 : Mention d’édition
-    place_260a = fget(src, "260", "a")
-    publ_260b = expand_epfl(fget(src, "260", "b"))
-    date_260c = fget(src, "260", "c")
+    publ_264b = expand_epfl(publ_260b)
     subf_264: list[Subfield] = []
     if place_260a:
         subf_264.append(Subfield("a", place_260a))
-    if publ_260b:
-        subf_264.append(Subfield("b", publ_260b))
+    if publ_264b:
+        subf_264.append(Subfield("b", publ_264b))
     if date_260c:
         subf_264.append(Subfield("c", date_260c))
     if subf_264:
         dst.add_field(Field(tag="264", indicators=[" ", "1"], subfields=subf_264))
 
     # 300 __ : Description matérielle
-    pages_300a = ensure_pages_suffix(fget(src, "300", "a"))
+    pages_300a = ensure_pages_suffix(fget_indexed(by_tag, "300", "a"))
     subf_300: list[Subfield] = []
     if pages_300a:
         subf_300.append(Subfield("a", pages_300a))
@@ -316,47 +503,26 @@ def build_final_record(src: Record) -> Record:
     dst.add_field(Field(tag="300", indicators=[" ", " "], subfields=subf_300))
 
     # 336 / 337 / 338 : RDA - statiques
-    dst.add_field(
-        Field(
-            tag="336",
-            indicators=[" ", " "],
-            subfields=[Subfield("b", "txt"), Subfield("2", "rdacontent")],
-        )
-    )
-    dst.add_field(
-        Field(
-            tag="337",
-            indicators=[" ", " "],
-            subfields=[Subfield("b", "n"), Subfield("2", "rdamedia")],
-        )
-    )
-    dst.add_field(
-        Field(
-            tag="338",
-            indicators=[" ", " "],
-            subfields=[Subfield("b", "nc"), Subfield("2", "rdacarrier")],
-        )
-    )
+    for tag, subfields in BIB_RDA_FIELDS:
+        dst.add_field(Field(tag=tag, indicators=IND_BLANK, subfields=list(subfields)))
 
     # 502 __ : Note de thèse (unique)
     subf_502: list[Subfield] = []
 
-    b_336a = fget(src, "336", "a")
+    b_336a = fget_indexed(by_tag, "336", "a")
     if b_336a:
         subf_502.append(
             Subfield("b", "Thèse" if b_336a.strip().lower() == "theses" else b_336a)
         )
 
-    a260a = fget(src, "260", "a")
-    a260b = fget(src, "260", "b")
-    if a260a or a260b:
-        subf_502.append(Subfield("c", f"{a260b or ''} {a260a or ''}".strip()))
+    if place_260a or publ_260b:
+        subf_502.append(Subfield("c", f"{publ_260b or ''} {place_260a or ''}".strip()))
 
-    d_920b = fget(src, "920", "b")
+    d_920b = fget_indexed(by_tag, "920", "b")
     if d_920b:
         subf_502.append(Subfield("d", d_920b))
 
-    a088a = fget(src, "088", "a")
+    a088a = fget_indexed(by_tag, "088", "a")
     if a088a:
         subf_502.append(Subfield("o", f"n° {a088a}"))
 
@@ -364,13 +530,15 @@ def build_final_record(src: Record) -> Record:
         dst.add_field(Field(tag="502", indicators=[" ", " "], subfields=subf_502))
 
     # 520 __ : Résumé (unique)
-    keywords = [k.strip() for k in fget_all(src, "653", "a") if k and k.strip()]
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for k in keywords:
-        if k not in seen:
-            seen.add(k)
-            deduped.append(k)
+    # Dédoublonnage en conservant l'ordre d'apparition (dict ordonné)
+    deduped = list(
+        dict.fromkeys(
+            k.strip()
+            for f in by_tag.get("653", ())
+            for k in f.get_subfields("a")
+            if k and k.strip()
+        )
+    )
     subf_520: list[Subfield] = [Subfield("5", "CH-ZuSLS EPFL")]
     if deduped:
         joined = "; ".join(deduped).replace("||", "; ")
@@ -378,46 +546,20 @@ def build_final_record(src: Record) -> Record:
     dst.add_field(Field(tag="520", indicators=[" ", " "], subfields=subf_520))
 
     # 655 _7 : Type de document (statique)
-    dst.add_field(
-        Field(
-            tag="655",
-            indicators=[" ", "7"],
-            subfields=[
-                Subfield("a", "Thèses et écrits académiques"),
-                Subfield("0", "(IDREF)027253139"),
-                Subfield("2", "idref"),
-            ],
-        )
-    )
-    dst.add_field(
-        Field(
-            tag="655",
-            indicators=[" ", "7"],
-            subfields=[
-                Subfield("a", "Hochschulschrift"),
-                Subfield("2", "gnd-content"),
-            ],
-        )
-    )
-    dst.add_field(
-        Field(
-            tag="655",
-            indicators=[" ", "7"],
-            subfields=[
-                Subfield("a", "Tesi"),
-                Subfield("2", "sbt12-content"),
-            ],
-        )
-    )
+    for subfields in BIB_655_SUBFIELDS:
+        dst.add_field(Field(tag="655", indicators=IND_655, subfields=list(subfields)))
 
     # 700 1_ : Directeur (720$a, priorité ind2='2')
+    # Un seul passage : on garde le premier 720$a et on s'arrête dès qu'un ind2='2' est trouvé
     cand_720 = None
-    for f in src.get_fields("720"):
-        if f.indicators[1] == "2" and "a" in f:
+    for f in by_tag.get("720", ()):
+        if "a" not in f:
+            continue
+        if f.indicators[1] == "2":
             cand_720 = f
             break
-    if not cand_720:
-        cand_720 = next((f for f in src.get_fields("720") if "a" in f), None)
+        if cand_720 is None:
+            cand_720 = f
     if cand_720:
         dst.add_field(
             Field(
@@ -447,11 +589,14 @@ def extract_marc_info(record: Record) -> Dict[str, Optional[str]]:
     responsibility: Optional[str] = None
     author: Optional[str] = None
 
-    if record["001"]:
-        infoscience_id = record["001"].data
+    by_tag = index_fields(record)
+
+    f001 = by_tag.get("001")
+    if f001:
+        infoscience_id = f001[0].data
 
     # 245 : titre + mention de responsabilité
-    title_fields = record.get_fields("245")
+    title_fields = by_tag.get("245")
     if title_fields:
         f245 = title_fields[0]
         title_parts = [f245.get("a"), f245.get("b")]
@@ -461,7 +606,7 @@ def extract_marc_info(record: Record) -> Dict[str, Optional[str]]:
         responsibility = clean_html(f245.get("c"))
 
     # 100 : auteur principal
-    f100s = record.get_fields("100")
+    f100s = by_tag.get("100")
     if f100s:
         author = f100s[0].get("a")
 
@@ -478,25 +623,81 @@ def extract_marc_info(record: Record) -> Dict[str, Optional[str]]:
 # =============================================================================
 
 
+@lru_cache(maxsize=8)
+def load_xml_schema_cached(xsd_path: str, mtime_ns: int) -> Optional[etree.XMLSchema]:
+    """
+    Parse un fichier XSD ; mis en cache par (chemin, date de modification en ns).
+    Retourne None si le XSD est invalide.
+    """
+    try:
+        return etree.XMLSchema(etree.parse(xsd_path))
+    except Exception as e:
+        LOGGER.warning("⚠️ Erreur lors du chargement XSD '%s' : %s", xsd_path, e)
+        return None
+
+
 def load_xml_schema(xsd_path: str) -> Optional[etree.XMLSchema]:
     """
     Charge un fichier XSD et retourne un objet XMLSchema.
     Retourne None en cas d'erreur (fichier manquant ou XSD invalide).
+    Le résultat est mis en cache : un XSD n'est re-parsé que s'il a été
+    modifié depuis le dernier chargement.
     """
     try:
-        xsd_file = Path(xsd_path)
-        if not xsd_file.exists():
-            print(f"⚠️ XSD non trouvé : {xsd_path}")
-            return None
+        mtime_ns = Path(xsd_path).stat().st_mtime_ns
+    except OSError:
+        LOGGER.warning("⚠️ XSD non trouvé : %s", xsd_path)
+        return None
+    return load_xml_schema_cached(str(xsd_path), mtime_ns)
 
-        schema_doc = etree.parse(str(xsd_file))
-        return etree.XMLSchema(schema_doc)
 
+@lru_cache(maxsize=4)
+def load_bib_record_schema_cached(
+    marc_xsd_path: str,
+    marc_mtime_ns: int,
+    bib_xsd_path: str,
+    bib_mtime_ns: int,
+) -> Optional[etree.XMLSchema]:
+    """
+    Construit le schéma combiné <bib> + <record> ; mis en cache par
+    (chemin, date de modification en ns) des deux XSD.
+    """
+    wrapper = (
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+        f'<xs:import namespace="{MARC_XML_NS}" schemaLocation="{Path(marc_xsd_path).resolve().as_uri()}"/>'
+        f'<xs:include schemaLocation="{Path(bib_xsd_path).resolve().as_uri()}"/>'
+        "</xs:schema>"
+    )
+    try:
+        return etree.XMLSchema(etree.fromstring(wrapper.encode("utf-8")))
     except Exception as e:
-        print(f"⚠️ Erreur lors du chargement XSD '{xsd_path}' : {e}")
+        LOGGER.warning("⚠️ Erreur lors du chargement du schéma combiné bib/MARC21 : %s", e)
         return None
 
 
+def load_bib_record_schema(marc_xsd_path: str, bib_xsd_path: str) -> Optional[etree.XMLSchema]:
+    """
+    Charge un schéma combiné <bib> Alma + <record> MARC21.
+
+    Dans rest_bib.xsd, le <record> est un xs:any (processContents="lax") :
+    en important MARC21slim.xsd, une seule validation du <bib> couvre aussi
+    le <record>. Retourne None si un des XSD est absent ou invalide.
+    """
+    try:
+        marc_mtime_ns = Path(marc_xsd_path).stat().st_mtime_ns
+        bib_mtime_ns = Path(bib_xsd_path).stat().st_mtime_ns
+    except OSError:
+        LOGGER.warning("⚠️ XSD non trouvé : %s / %s", marc_xsd_path, bib_xsd_path)
+        return None
+    return load_bib_record_schema_cached(
+        str(marc_xsd_path), marc_mtime_ns, str(bib_xsd_path), bib_mtime_ns
+    )
+
+
+# Verrou autour de validate() + lecture de error_log (voir validate_xml_element)
+XSD_VALIDATION_LOCK = threading.Lock()
+
+
 def validate_xml_element(
     element: Optional[etree._Element],
     schema: Optional[etree.XMLSchema] = None,
@@ -515,28 +716,47 @@ def validate_xml_element(
     if schema is None:
         return True, []
 
-    if not schema.validate(element):
+    # Schémas compilés partagés entre threads (--workers) : validate() vide puis
+    # remplit schema.error_log, la lecture des erreurs doit donc rester atomique.
+    with XSD_VALIDATION_LOCK:
+        if schema.validate(element):
+            return True, []
         errors = [
             f"{err.message} (line {err.line}, col {err.column})"
             for err in schema.error_log
         ]
-        return False, errors
-
-    return True, []
+    return False, errors
 
 
 def validate_bib_and_record(
     bib_element: etree._Element,
     marc_schema: Optional[etree.XMLSchema] = None,
     bib_schema: Optional[etree.XMLSchema] = None,
+    bib_record_schema: Optional[etree.XMLSchema] = None,
 ) -> Dict[str, Any]:
     """
     Valide :
       - le <record> MARC interne avec un schéma MARC21 (marc_schema)
       - le <bib> Alma avec un schéma Alma (bib_schema)
+
+    Si bib_record_schema (voir load_bib_record_schema) est fourni, bib et record
+    sont d'abord validés en un seul passage ; les validations séparées ne sont
+    refaites qu'en cas d'échec, pour attribuer les erreurs à record / bib.
     """
-    ns_marc = {"marc": "http://www.loc.gov/MARC21/slim"}
-    rec_element = bib_element.find(".//marc:record", namespaces=ns_marc)
+    rec_elements = XPATH_MARC_RECORD(bib_element)
+    rec_element = rec_elements[0] if rec_elements else None
+
+    if (
+        rec_element is not None
+        and bib_record_schema is not None
+        and validate_xml_element(bib_element, bib_record_schema, element_label="bib")[0]
+    ):
+        return {
+            "record_valid": True,
+            "record_errors": [],
+            "bib_valid": True,
+            "bib_errors": [],
+        }
 
     record_valid, record_errors = validate_xml_element(
         rec_element,
@@ -596,10 +816,9 @@ def get_last_call_number_from_analytics() -> Tuple[Optional[int], Optional[str]]
     Appelle l'API Analytics et retourne (valeur, erreur).
     """
     try:
-        config = dotenv_values(".env")
-        base_url = config.get("ALMA_API_URL")
-        analytics_path = config.get("ALMA_API_ANALYTICS_PATH")
-        api_key = config.get("ALMA_API_KEY")
+        base_url = DOTENV_CONFIG.get("ALMA_API_URL")
+        analytics_path = DOTENV_CONFIG.get("ALMA_API_ANALYTICS_PATH")
+        api_key = DOTENV_CONFIG.get("ALMA_API_KEY")
 
         if not base_url or not analytics_path or not api_key:
             error = "Variables manquantes dans .env"
@@ -608,26 +827,26 @@ def get_last_call_number_from_analytics() -> Tuple[Optional[int], Optional[str]]
         api_url = f"{base_url}{analytics_path}"
 
         headers = {"Authorization": f"apikey {api_key}"}
-        resp = requests.get(api_url, headers=headers, timeout=30)
-
-        if resp.status_code != 200:
-            error = f"Erreur API: HTTP {resp.status_code}"
-            return None, error
-
-        root = ET.fromstring(resp.text)
-        ns = {"ns": "urn:schemas-microsoft-com:xml-analysis:rowset"}
-        first_row = root.find(".//ns:Row", ns)
-        if first_row is None:
+        with HTTP_SESSION.get(api_url, headers=headers, stream=True, timeout=30) as resp:
+            if resp.status_code != 200:
+                error = f"Erreur API: HTTP {resp.status_code}"
+                return None, error
+
+            # Parsing lxml au fil de la lecture du flux (pas de copie de resp.content)
+            resp.raw.decode_content = True
+            root = etree.parse(resp.raw).getroot()
+        col3_texts = XPATH_ANALYTICS_FIRST_COLUMN3(root)
+        if not col3_texts and root.find(f".//{{{NS_ANALYTICS_ROWSET}}}Row") is None:
             error = "Aucune Row dans la réponse."
             return None, error
 
-        col3 = first_row.find("ns:Column3", ns)
+        col3 = col3_texts[0].strip() if col3_texts else ""
 
-        if col3 is None or not col3.text or not col3.text.strip().isdigit():
+        if not col3.isdigit():
             error = "Column3 introuvable ou non numérique."
             return None, error
 
-        value = int(col3.text.strip())
+        value = int(col3)
         return value, None
 
     except Exception as e:  # réseau, parsing, etc.
@@ -640,13 +859,9 @@ def safe(v: Any) -> str:
     return v if isinstance(v, (str, int, float)) else repr(v)
 
 
-def first_day_previous_month(ref: Optional[date] = None) -> str:
-    """
-    Renvoie la chaîne 'YYYY-MM-01' correspondant au premier jour du mois précédent.
-    """
-    if ref is None:
-        ref = date.today()
-    year, month = ref.year, ref.month
+@lru_cache(maxsize=4)
+def first_day_previous_month_cached(year: int, month: int) -> str:
+    """Premier jour du mois précédant (year, month), au format 'YYYY-MM-01'."""
     if month == 1:
         year -= 1
         month = 12
@@ -654,6 +869,16 @@ def first_day_previous_month(ref: Optional[date] = None) -> str:
         month -= 1
     return f"{year:04d}-{month:02d}-01"
 
+
+def first_day_previous_month(ref: Optional[date] = None) -> str:
+    """
+    Renvoie la chaîne 'YYYY-MM-01' correspondant au premier jour du mois précédent.
+    """
+    # date.today() résolue hors du cache : un process long change bien de mois
+    if ref is None:
+        ref = date.today()
+    return first_day_previous_month_cached(ref.year, ref.month)
+
 def get_date_range(ref: Optional[date] = None) -> Tuple[str, str]:
     """
     Retourne (start, end) pour la requête Infoscience.
@@ -685,39 +910,111 @@ def build_infoscience_url(
     spc_rpp: int = 100,
     ref: Optional[date] = None,
     of_format: str = "xm",
+    date_range: Optional[Tuple[str, str]] = None,
 ) -> str:
     """
     Construit l'URL Infoscience 'discover/export' pour UNE page (spc.page),
     avec spc.rpp résultats par page.
 
-    - spc_page : numéro de page (1, 2, 3, ...)
-    - spc_rpp  : nombre de résultats par page (ex. 100)
-    - ref      : date de référence pour le filtre dc.date.created (format date) ;
-    - of_format: format de sortie (xm, xmJ, etc.)
+    - spc_page  : numéro de page (1, 2, 3, ...)
+    - spc_rpp   : nombre de résultats par page (ex. 100)
+    - ref       : date de référence pour le filtre dc.date.created (format date) ;
+    - of_format : format de sortie (xm, xmJ, etc.)
+    - date_range: (start, end) déjà calculé (évite de le recalculer à chaque page)
     """
-    base = "https://infoscience.epfl.ch/server/api/discover/export"
-    configuration = "researchoutputs"
-    f_types = "thesis-coar-types:c_db06,authority"
-
-    start, end = get_date_range(ref)
+    start, end = date_range if date_range is not None else get_date_range(ref)
     query_value = (
         f"dc.publisher:(EPFL) OR dc.publisher:(Ecole polytechnique federale de Lausanne) "
         f"dc.date.created:[{start} TO {end}]"
     )
-    query_enc = quote(query_value, safe="")
-
-    params = (
-        f"configuration={configuration}"
-        f"&spc.page={spc_page}"
-        f"&spc.rpp={spc_rpp}"
-        f"&f.types={quote(f_types, safe='')}"
-        f"&query={query_enc}"
-        f"&spc.sf=dc.date.accessioned"
-        f"&spc.sd=DESC"
-        f"&of={of_format}"
+
+    # Encodage de tous les paramètres en une passe (quote, safe="" : %20 et non '+')
+    params = urlencode(
+        (
+            ("configuration", INFOSCIENCE_CONFIGURATION),
+            ("spc.page", spc_page),
+            ("spc.rpp", spc_rpp),
+            ("f.types", INFOSCIENCE_F_TYPES),
+            ("query", query_value),
+            ("spc.sf", "dc.date.accessioned"),
+            ("spc.sd", "DESC"),
+            ("of", of_format),
+        ),
+        safe="",
+        quote_via=quote,
     )
 
-    return f"{base}?{params}"
+    return f"{INFOSCIENCE_EXPORT_URL}?{params}"
+
+
+def fetch_infoscience_page(url: str) -> bytes:
+    """Télécharge une page d'export Infoscience et retourne le MARCXML brut."""
+    resp = HTTP_SESSION.get(url, timeout=60)
+    resp.raise_for_status()
+    return resp.content
+
+
+# Tags lxml -> nature de l'élément MARCXML (avec ou sans namespace, comme pymarc non strict)
+MARCXML_ELEMENT_KINDS = {
+    tag: kind
+    for kind in ("leader", "controlfield", "datafield", "subfield")
+    for tag in (f"{{{MARC_XML_NS}}}{kind}", kind)
+}
+
+
+def marcxml_element_to_record(record_el: etree._Element) -> Record:
+    """
+    Convertit un élément lxml <record> (MARCXML) en pymarc.Record,
+    sans repasser par le parseur XML de pymarc.
+    """
+    record = Record()
+    kinds = MARCXML_ELEMENT_KINDS
+
+    for child in record_el:
+        kind = kinds.get(child.tag)
+        if kind == "datafield":
+            record.add_field(
+                Field(
+                    child.get("tag"),
+                    Indicators(child.get("ind1", " "), child.get("ind2", " ")),
+                    subfields=[
+                        Subfield(sf.get("code"), sf.text or "")
+                        for sf in child
+                        if kinds.get(sf.tag) == "subfield"
+                    ],
+                )
+            )
+        elif kind == "controlfield":
+            cf = Field(child.get("tag"))
+            cf.data = child.text or ""
+            record.add_field(cf)
+        elif kind == "leader":
+            record.leader = Leader(child.text or "")
+
+    return record
+
+
+def iter_marcxml_records(source: Any) -> Iterable[Record]:
+    """
+    Parse un flux MARCXML de façon incrémentale (lxml.iterparse) et renvoie
+    les notices pymarc une à une, sans construire le document complet.
+
+    - source : objet fichier (ex. resp.raw) ou chemin
+    """
+    context = etree.iterparse(
+        source,
+        events=("end",),
+        tag=(f"{{{MARC_XML_NS}}}record", "record"),
+    )
+    for _, elem in context:
+        record = marcxml_element_to_record(elem)
+        # Libère la notice traitée et les précédentes (mémoire bornée)
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+        yield record
 
 
 def iter_infoscience_records(
@@ -748,12 +1045,14 @@ def iter_infoscience_records(
             "f.dateIssued.min=2025&f.author_editor=koch,%20manuel%20pascal,equals&of=xm"
         )
         logger.info("Téléchargement Infoscience (URL statique) : %s", url)
-        resp = requests.get(url, timeout=60)
-        resp.raise_for_status()
-        records = parse_xml_to_array(io.BytesIO(resp.content))
-        logger.info("%d notice(s) récupérée(s) depuis l'URL statique.", len(records))
-        for r in records:
-            yield r
+        with HTTP_SESSION.get(url, stream=True, timeout=60) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            count = 0
+            for r in iter_marcxml_records(resp.raw):
+                count += 1
+                yield r
+        logger.info("%d notice(s) récupérée(s) depuis l'URL statique.", count)
         return
 
     # Cas URL dynamique : pagination via spc.page
@@ -763,41 +1062,58 @@ def iter_infoscience_records(
     start, end = get_date_range(ref)
     logger.info("Infoscience date range: %s → %s", start, end)
 
-    while True:
+    def submit_page(page: int) -> Future:
         url = build_infoscience_url(
-            spc_page=spc_page,
+            spc_page=page,
             spc_rpp=spc_rpp,
-            ref=ref,
             of_format=of_format,
+            date_range=(start, end),
         )
-        logger.info("Téléchargement Infoscience spc.page=%d : %s", spc_page, url)
-
-        try:
-            resp = requests.get(url, timeout=60)
-            resp.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            logger.error("Erreur HTTP sur spc.page=%d : %s", spc_page, e)
-            break
-
-        try:
-            records = parse_xml_to_array(io.BytesIO(resp.content))
-        except Exception as e:
-            logger.error("Erreur de parsing MARCXML sur spc.page=%d : %s", spc_page, e)
-            break
+        logger.info("Téléchargement Infoscience spc.page=%d : %s", page, url)
+        return prefetch_pool.submit(fetch_infoscience_page, url)
 
-        if not records:
-            logger.info(
-                "Aucune notice sur spc.page=%d -> fin de la pagination Infoscience.",
-                spc_page,
-            )
-            break
+    # La page N+1 est téléchargée en arrière-plan pendant que les notices de
+    # la page N sont traitées par l'appelant (au plus une page d'avance).
+    prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="infoscience")
+    try:
+        page_future = submit_page(spc_page)
+        while True:
+            try:
+                content = page_future.result()
+            except requests.exceptions.RequestException as e:
+                logger.error("Erreur HTTP sur spc.page=%d : %s", spc_page, e)
+                break
+
+            # Les notices sont renvoyées au fil du parsing : on compte au passage
+            # pour détecter la fin de la pagination (page vide).
+            count = 0
+            next_future: Optional[Future] = None
+            try:
+                for r in iter_marcxml_records(io.BytesIO(content)):
+                    count += 1
+                    if next_future is None:
+                        next_future = submit_page(spc_page + 1)
+                    yield r
+            except Exception as e:
+                logger.error("Erreur de parsing MARCXML sur spc.page=%d : %s", spc_page, e)
+                total += count
+                break
+
+            total += count
+            if not count:
+                logger.info(
+                    "Aucune notice sur spc.page=%d -> fin de la pagination Infoscience.",
+                    spc_page,
+                )
+                break
 
-        logger.info("%d notice(s) récupérée(s) sur spc.page=%d.", len(records), spc_page)
-        total += len(records)
-        for r in records:
-            yield r
+            logger.info("%d notice(s) récupérée(s) sur spc.page=%d.", count, spc_page)
 
-        spc_page += 1  # page suivante
+            spc_page += 1  # page suivante
+            page_future = next_future
+    finally:
+        # Arrêt anticipé (max_records, erreur) : on n'attend pas la page en cours
+        prefetch_pool.shutdown(wait=False, cancel_futures=True)
 
     logger.info("Total de %d notices récupérées au total depuis Infoscience.", total)
 
@@ -811,72 +1127,175 @@ def fetch_marc_record_from_sru(
     title: str,
     author: str,
     institution_code: str = "NETWORK",
+    verbose: bool = False,
 ) -> bool:
     """
     Vérifie si une notice existe déjà dans swisscovery via SRU.
+
+    Par défaut, seul le nombre de résultats est demandé (maximumRecords=0) :
+    la réponse se limite à <numberOfRecords>, sans notice MARC à parser.
+    Avec verbose=True, la première notice est récupérée et son détail loggé.
     """
     base_url = f"https://swisscovery.ch/view/sru/41SLSP_{institution_code}"
     params = {
         "version": "1.2",
         "operation": "searchRetrieve",
         "query": f'title="{title}" AND creator="{author}"',
-        "maximumRecords": 1,
+        "maximumRecords": 1 if verbose else 0,
     }
-    response = requests.get(base_url, params=params, timeout=30)
-    if response.status_code != 200:
-        print(f"HTTP error: {response.status_code}")
-        return False
+    with HTTP_SESSION.get(base_url, params=params, stream=True, timeout=30) as response:
+        if response.status_code != 200:
+            LOGGER.warning("SRU HTTP error: %s", response.status_code)
+            return False
 
-    root = etree.fromstring(response.content)
-    ns = {
-        "srw": "http://www.loc.gov/zing/srw/",
-        "marc": "http://www.loc.gov/MARC21/slim",
-    }
+        # Parsing lxml au fil de la lecture du flux (pas de copie de response.content)
+        response.raw.decode_content = True
+        root = etree.parse(response.raw).getroot()
+
+    if not verbose:
+        nb_records = (root.findtext("srw:numberOfRecords", namespaces=NS_SRW) or "").strip()
+        return nb_records.isdigit() and int(nb_records) > 0
 
-    record_data = root.find(".//srw:recordData", ns)
+    record_data = root.find(".//srw:recordData", NS_SRW)
     if record_data is None:
         return False
 
-    marc_record = record_data.find("marc:record", ns)
+    marc_record = record_data.find("marc:record", NS_SRW)
     if marc_record is None:
-        print("No MARC record found.")
+        LOGGER.info("SRU : no MARC record found.")
         return False
 
     def get_subfield(tag: str, code: str) -> Optional[str]:
-        for field in marc_record.findall(f"marc:datafield[@tag='{tag}']", ns):
-            for subfield in field.findall("marc:subfield", ns):
-                if subfield.get("code") == code:
-                    return subfield.text
-        return None
+        values = XPATH_SUBFIELD_TEXT(marc_record, tag=tag, code=code)
+        return values[0] if values else None
 
     title_field = get_subfield("245", "a")
     author_field = get_subfield("100", "a") or get_subfield("700", "a")
     publisher_field = get_subfield("260", "b") or get_subfield("264", "b")
     year_field = get_subfield("260", "c") or get_subfield("264", "c")
 
-    print("--- MARC Record already exist into Alma (swisscovery) ---")
-    print(f"Title: {title_field}")
-    print(f"Author: {author_field}")
-    print(f"Publisher: {publisher_field}")
-    print(f"Year: {year_field}")
-    print("--- No need to create again ---")
+    LOGGER.info(
+        "MARC Record already exist into Alma (swisscovery), no need to create again: "
+        "title=%s author=%s publisher=%s year=%s",
+        title_field,
+        author_field,
+        publisher_field,
+        year_field,
+    )
 
     return True
 
 
+# Recherches SRU (titre, auteur, institution) ayant trouvé une notice.
+# Seuls les résultats positifs sont gardés : une notice absente peut être
+# créée entre-temps, et une erreur SRU renvoie aussi False.
+SRU_KNOWN_RECORDS: set = set()
+SRU_KNOWN_RECORDS_LOCK = threading.Lock()
+
+
+def clear_sru_cache() -> None:
+    """Oublie les notices SRU déjà trouvées (ex. entre deux jobs --batch-file)."""
+    with SRU_KNOWN_RECORDS_LOCK:
+        SRU_KNOWN_RECORDS.clear()
+
+
+def sru_record_exists(
+    title: str,
+    author: str,
+    institution_code: str = "NETWORK",
+    verbose: bool = False,
+) -> bool:
+    """
+    Comme fetch_marc_record_from_sru, mais un couple (titre, auteur) déjà
+    trouvé n'est plus réinterrogé dans le process. La recherche SRU ignorant
+    la casse, les clés sont normalisées (espaces de bord, minuscules).
+    Les résultats négatifs et les erreurs ne sont pas mis en cache.
+    """
+    key = (title.strip().lower(), author.strip().lower(), institution_code)
+    if key in SRU_KNOWN_RECORDS:
+        return True
+
+    exists = fetch_marc_record_from_sru(
+        key[0], key[1], institution_code=institution_code, verbose=verbose
+    )
+    if exists:
+        with SRU_KNOWN_RECORDS_LOCK:
+            SRU_KNOWN_RECORDS.add(key)
+    return exists
+
+
 # =============================================================================
 # ALMA — BIB
 # =============================================================================
 
 
-def build_bib_with_record(src_record: Record) -> Tuple[etree._Element, etree._Element]:
+# Squelettes réutilisés par copie (deepcopy lxml) : l'élément racine <record>,
+# avec ses namespaces et xsi:schemaLocation, et la <holding> avec <holding_id>.
+MARC_RECORD_TEMPLATE = etree.Element(
+    f"{{{MARC_XML_NS}}}record",
+    nsmap={None: MARC_XML_NS, "xsi": XSI_NS},
+)
+MARC_RECORD_TEMPLATE.set(f"{{{XSI_NS}}}schemaLocation", MARC_XML_SCHEMA_LOCATION)
+
+HOLDING_TEMPLATE = etree.Element("holding")
+etree.SubElement(HOLDING_TEMPLATE, "holding_id")
+
+
+def record_to_lxml(record: Record) -> etree._Element:
+    """
+    Construit directement l'élément MARCXML <record> (lxml) d'un pymarc.Record,
+    sans passer par une sérialisation intermédiaire en octets.
+    """
+    rec_el = copy.deepcopy(MARC_RECORD_TEMPLATE)
+
+    etree.SubElement(rec_el, f"{{{MARC_XML_NS}}}leader").text = str(record.leader)
+
+    for f in record.fields:
+        if f.control_field:
+            cf_el = etree.SubElement(rec_el, f"{{{MARC_XML_NS}}}controlfield", tag=f.tag)
+            cf_el.text = f.data
+        else:
+            df_el = etree.SubElement(
+                rec_el,
+                f"{{{MARC_XML_NS}}}datafield",
+                ind1=f.indicators.first,
+                ind2=f.indicators.second,
+                tag=f.tag,
+            )
+            for sf in f.subfields:
+                etree.SubElement(df_el, f"{{{MARC_XML_NS}}}subfield", code=sf.code).text = sf.value
+
+    return rec_el
+
+
+def as_xml_data(element: etree._Element) -> XmlData:
+    """
+    Enveloppe un élément lxml dans un XmlData almapiwrapper, sans copie.
+
+    Passé tel quel, un _Element est converti par le wrapper via
+    XmlData(etree.tostring(...)), soit une sérialisation suivie d'un
+    re-parsing avant l'envoi à Alma.
+    """
+    from almapiwrapper.record import XmlData
+
+    xml_data = XmlData()
+    xml_data.content = element
+    return xml_data
+
+
+def build_bib_with_record(
+    src_record: Record,
+    final_record: Optional[Record] = None,
+) -> Tuple[etree._Element, etree._Element]:
     """
     Construit l'élément <bib> Alma à partir d'une notice source Infoscience.
+    final_record : record déjà issu de build_final_record(src_record), réutilisé
+    tel quel pour ne pas reconstruire la notice.
     """
-    final_record = build_final_record(src_record)
+    if final_record is None:
+        final_record = build_final_record(src_record)
 
-    marcxml_bytes = record_to_xml(final_record, namespace=True)
-    rec_el = etree.fromstring(marcxml_bytes)
+    rec_el = record_to_lxml(final_record)
 
     bib_el = etree.Element("bib")
     bib_el.append(rec_el)
@@ -899,6 +1318,8 @@ def delete_holding(
     """
     Supprime une holding Alma à partir de son holding_id.
     """
+    from almapiwrapper.inventory import Holding
+
     mms_id = bib_obj.get_mms_id()
     if not mms_id:
         return False, "MMS ID introuvable."
@@ -922,38 +1343,53 @@ def delete_holding(
     return True, None
 
 
+def fetch_holdings(bib_obj: IzBib) -> List[Holding]:
+    """
+    Relit les holdings d'une notice dans Alma (cache du wrapper invalidé).
+
+    IzBib.get_holdings() remplit bib_obj._holdings en place : à appeler depuis
+    un seul thread, la liste retournée est une copie partageable.
+    """
+    if hasattr(bib_obj, "_holdings"):
+        bib_obj._holdings = None
+
+    try:
+        return list(bib_obj.get_holdings() or [])
+    except Exception as e:
+        LOGGER.warning("⚠️ Impossible de récupérer les holdings : %s", e)
+        return []
+
+
 def find_existing_holding(
     bib_obj: IzBib,
     library_code: str,
     location: str,
+    holdings: Optional[List[Holding]] = None,
 ) -> Optional[Holding]:
     """
     Recherche une holding existante dans Alma pour une combinaison
     (library_code, location).
+    holdings : liste déjà lue par fetch_holdings, sinon relue ici.
     """
-    if hasattr(bib_obj, "_holdings"):
-        bib_obj._holdings = None
-
-    try:
-        holdings = bib_obj.get_holdings()
-    except Exception as e:
-        print(f"⚠️ Impossible de récupérer les holdings : {e}")
-        return None
+    if holdings is None:
+        holdings = fetch_holdings(bib_obj)
 
     if not holdings:
         return None
 
     for h in holdings:
         if h.error:
-            print(f"⚠️ Holding ignorée (erreur wrapper) : {h.error_msg}")
+            LOGGER.warning("⚠️ Holding ignorée (erreur wrapper) : %s", h.error_msg)
             continue
 
         lib = h.library
         loc = h.location
 
         if not lib or not loc:
-            print(
-                f"⚠️ Holding ignorée : library/location manquants (lib={lib}, loc={loc})"
+            LOGGER.warning(
+                "⚠️ Holding ignorée : library/location manquants (lib=%s, loc=%s)",
+                lib,
+                loc,
             )
             continue
 
@@ -963,43 +1399,51 @@ def find_existing_holding(
     return None
 
 
-def build_holding_marc(
-    library_code: str,
-    location: str,
-    call_number: str,
-) -> Record:
-    """
-    Construit un record MARC interne pour une holding Alma.
-    """
-    record = Record(force_utf8=True)
-    record.leader = "00137nx##a2200061zn#4500"
-
-    today_str = date.today().strftime("%y%m%d")
-    record.add_field(Field(tag="008", data=f"{today_str}2u####8###4001uueng0000000"))
-    record.add_field(
-        Field(
-            tag="852",
-            indicators=["4", " "],
-            subfields=[
-                Subfield("b", str(library_code)),
-                Subfield("c", str(location)),
-                Subfield("j", str(call_number)),
-            ],
-        )
+def build_holding_skeleton() -> etree._Element:
+    """
+    Construit le squelette complet d'une <holding> : <holding_id>, puis le
+    <record> MARCXML avec leader, 008 et 852 (sous-champs b, c, j) vides.
+    """
+    holding_el = copy.deepcopy(HOLDING_TEMPLATE)
+    rec_el = copy.deepcopy(MARC_RECORD_TEMPLATE)
+    holding_el.append(rec_el)
+
+    etree.SubElement(rec_el, f"{{{MARC_XML_NS}}}leader").text = HOLDING_LEADER
+    etree.SubElement(rec_el, f"{{{MARC_XML_NS}}}controlfield", tag="008")
+    df_el = etree.SubElement(
+        rec_el,
+        f"{{{MARC_XML_NS}}}datafield",
+        ind1="4",
+        ind2=" ",
+        tag="852",
     )
-    return record
+    for code in ("b", "c", "j"):
+        etree.SubElement(df_el, f"{{{MARC_XML_NS}}}subfield", code=code)
+
+    return holding_el
+
 
+HOLDING_SKELETON = build_holding_skeleton()
 
-def build_holding_xml(record: Record) -> etree._Element:
+
+def build_holding_xml(
+    library_code: str,
+    location: str,
+    call_number: str,
+    run_date: Optional[date] = None,
+) -> etree._Element:
     """
-    Convertit un record MARC (pymarc.Record) en XML Alma <holding>.
+    Construit l'XML Alma <holding> par copie du squelette, sans record
+    pymarc intermédiaire : seuls la 008 et les sous-champs 852 sont remplis.
+    run_date : date de création (008/00-05), aujourd'hui si omise.
     """
-    marcxml_bytes = record_to_xml(record, namespace=True)
-    record_el = etree.fromstring(marcxml_bytes)
+    holding_el = copy.deepcopy(HOLDING_SKELETON)
+    _, cf_008, df_852 = holding_el[1]
 
-    holding_el = etree.Element("holding")
-    etree.SubElement(holding_el, "holding_id")
-    holding_el.append(record_el)
+    cf_008.text = f"{(run_date or date.today()).strftime('%y%m%d')}{HOLDING_008_SUFFIX}"
+    df_852[0].text = str(library_code)
+    df_852[1].text = str(location)
+    df_852[2].text = str(call_number)
 
     return holding_el
 
@@ -1013,12 +1457,14 @@ def create_holding_in_alma(
     """
     Crée une holding dans Alma via almapiwrapper.
     """
+    from almapiwrapper.inventory import Holding
+
     mms_id = bib_obj.get_mms_id()
     if not mms_id:
         return None, "MMS ID introuvable."
 
     holding = Holding(
-        data=holding_el,
+        data=as_xml_data(holding_el),
         mms_id=mms_id,
         zone=zone,
         env=env,
@@ -1041,14 +1487,18 @@ def creer_holding(
     zone: str = "HPH",
     env: str = "S",
     logger: Optional[logging.Logger] = None,
+    run_date: Optional[date] = None,
+    holdings: Optional[List[Holding]] = None,
 ) -> Optional[Holding]:
     """
     Crée (ou récupère) une holding dans Alma pour (library_code, location).
     Retourne l'objet Holding ou None si erreur.
+    holdings : holdings existantes déjà lues (voir fetch_holdings).
     """
-    log = logger.info if logger else print
+    # Logger du module par défaut (au lieu de print, qui ignorait les arguments %s)
+    log = (logger or LOGGER).info
 
-    existing = find_existing_holding(bib_obj, library_code, location)
+    existing = find_existing_holding(bib_obj, library_code, location, holdings=holdings)
     if existing:
         log(
             "ℹ️ Holding déjà existante (%s/%s) : %s",
@@ -1058,8 +1508,7 @@ def creer_holding(
         )
         return existing
 
-    record = build_holding_marc(library_code, location, call_number)
-    holding_el = build_holding_xml(record)
+    holding_el = build_holding_xml(library_code, location, call_number, run_date=run_date)
 
     is_valid, errors = validate_holding_xml(holding_el, holding_schema=holding_schema)
     if not is_valid:
@@ -1090,6 +1539,29 @@ def creer_holding(
 # =============================================================================
 
 
+# Localisation Alma -> (base_status, policy) de l'item créé
+ITEM_POLICY_BY_LOCATION = MappingProxyType({
+    "E02SP": ("04", "04"),
+    "E02XA": ("70", "70"),
+})
+
+
+@lru_cache(maxsize=64)
+def item_skeleton(item_data_tags: Tuple[str, ...]) -> etree._Element:
+    """
+    Squelette <item> réutilisé par copie (deepcopy lxml) : holding_data/holding_id
+    puis item_data avec les enfants demandés, dans l'ordre.
+    Construit une seule fois par combinaison de champs présents.
+    """
+    item_el = etree.Element("item")
+    holding_data_el = etree.SubElement(item_el, "holding_data")
+    etree.SubElement(holding_data_el, "holding_id")
+    item_data_el = etree.SubElement(item_el, "item_data")
+    for tag in item_data_tags:
+        etree.SubElement(item_data_el, tag)
+    return item_el
+
+
 def build_item_xml_for_holding(
     holding: Holding,
     base_status: str,
@@ -1106,36 +1578,34 @@ def build_item_xml_for_holding(
     if arrival_date is None:
         arrival_date = TODAY
 
-    item_el = etree.Element("item")
-
-    holding_data_el = etree.SubElement(item_el, "holding_data")
-    etree.SubElement(holding_data_el, "holding_id").text = holding.holding_id
-
-    item_data_el = etree.SubElement(item_el, "item_data")
-
-    etree.SubElement(item_data_el, "base_status").text = base_status
+    # (balise, texte) des enfants de <item_data>, dans l'ordre attendu par Alma
+    item_data = [("base_status", base_status)]
 
     if material_type_code:
-        etree.SubElement(item_data_el, "physical_material_type").text = material_type_code
+        item_data.append(("physical_material_type", material_type_code))
 
     if item_policy_code:
-        etree.SubElement(item_data_el, "policy").text = item_policy_code
+        item_data.append(("policy", item_policy_code))
 
     if po_line:
-        etree.SubElement(item_data_el, "po_line").text = po_line
+        item_data.append(("po_line", po_line))
 
-    etree.SubElement(item_data_el, "arrival_date").text = arrival_date
+    item_data.append(("arrival_date", arrival_date))
 
     if holding.library:
-        etree.SubElement(item_data_el, "library").text = holding.library
+        item_data.append(("library", holding.library))
     if holding.location:
-        etree.SubElement(item_data_el, "location").text = holding.location
+        item_data.append(("location", holding.location))
 
     if department_code and work_order_type:
-        etree.SubElement(item_data_el, "process_type").text = "WORK_ORDER_DEPARTMENT"
-        etree.SubElement(item_data_el, "work_order_type").text = work_order_type
-        etree.SubElement(item_data_el, "work_order_at").text = department_code
+        item_data.append(("process_type", "WORK_ORDER_DEPARTMENT"))
+        item_data.append(("work_order_type", work_order_type))
+        item_data.append(("work_order_at", department_code))
 
+    item_el = copy.deepcopy(item_skeleton(tuple(tag for tag, _ in item_data)))
+    item_el[0][0].text = holding.holding_id
+    for child, (_, text) in zip(item_el[1], item_data):
+        child.text = text
 
     return item_el
 
@@ -1150,25 +1620,24 @@ def creer_item_pour_une_holding(
     zone: str = "HPH",
     env: str = "S",
     logger: Optional[logging.Logger] = None,
+    arrival_date: Optional[str] = None,
 ) -> Optional[str]:
     """
     Crée un item pour une holding Alma déjà existante.
     """
-    log_info = logger.info if logger else print
-    log_error = logger.error if logger else print
+    # Logger du module par défaut (au lieu de print, qui ignorait les arguments %s)
+    logger = logger or LOGGER
+    log_info = logger.info
+    log_error = logger.error
 
     loc = holding.location
     lib = holding.library
 
-    if loc == "E02SP":
-        base_status = "04"
-        item_policy_code = "04"
-    elif loc == "E02XA":
-        base_status = "70"
-        item_policy_code = "70"
-    else:
+    policy = ITEM_POLICY_BY_LOCATION.get(loc)
+    if policy is None:
         log_info("⚠️ Localisation '%s' non gérée -> aucun item créé.", loc)
         return None
+    base_status, item_policy_code = policy
 
     log_info("WorkOrder params: work_order_type=%s department=%s", work_order_type, department_code)
 
@@ -1176,6 +1645,7 @@ def creer_item_pour_une_holding(
         holding=holding,
         base_status=base_status,
         po_line=po_line,
+        arrival_date=arrival_date,
         department_code=department_code,
         work_order_type=work_order_type,
         material_type_code=material_type_code,
@@ -1196,7 +1666,7 @@ def creer_item_pour_une_holding(
             department_code,
         )
 
-    if logger and logger.isEnabledFor(logging.DEBUG):
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "WorkOrder demandé: type=%s department=%s",
             work_order_type,
@@ -1204,6 +1674,7 @@ def creer_item_pour_une_holding(
         )
         logger.debug("XML ITEM envoyé:\n%s", etree.tostring(item_el, pretty_print=True, encoding="unicode"))
 
+    from almapiwrapper.inventory import Item
 
     item = Item(
         holding=holding,
@@ -1239,7 +1710,7 @@ def creer_item_pour_une_holding(
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class NoticeReport:
     record_index: int
     infoscience_id: Optional[str]
@@ -1255,7 +1726,14 @@ class NoticeReport:
     bib_status: Optional[str] = None
     bib_error: Optional[str] = None
 
-    locations: List[Dict[str, Any]] = field(default_factory=list)
+    # Une entrée par localisation, stockée colonne par colonne (listes parallèles)
+    location_codes: List[str] = field(default_factory=list)
+    holding_ids: List[Optional[str]] = field(default_factory=list)
+    holding_statuses: List[Optional[str]] = field(default_factory=list)
+    holding_errors: List[Optional[str]] = field(default_factory=list)
+    item_ids: List[Optional[str]] = field(default_factory=list)
+    item_statuses: List[Optional[str]] = field(default_factory=list)
+    item_errors: List[Optional[str]] = field(default_factory=list)
 
     def add_warning(self, msg: str) -> None:
         self.warnings.append(msg)
@@ -1270,60 +1748,44 @@ class NoticeReport:
         item_status: Optional[str] = None,
         item_error: Optional[str] = None,
     ) -> None:
-        self.locations.append(
-            {
-                "location": location,
-                "holding_id": holding_id,
-                "holding_status": holding_status,
-                "holding_error": holding_error,
-                "item_id": item_id,
-                "item_status": item_status,
-                "item_error": item_error,
-            }
-        )
+        self.location_codes.append(location or "")
+        self.holding_ids.append(holding_id)
+        self.holding_statuses.append(holding_status)
+        self.holding_errors.append(holding_error)
+        self.item_ids.append(item_id)
+        self.item_statuses.append(item_status)
+        self.item_errors.append(item_error)
 
     def to_csv_row(self) -> Dict[str, str]:
         """
         Retourne UNE seule ligne (dict) pour le CSV,
         en agrégeant holdings/items sur des colonnes concaténées.
         """
+        holding_locations = [code for code in self.location_codes if code]
+        holding_ids = [v for v in self.holding_ids if v]
+        item_ids = [v for v in self.item_ids if v]
 
-        holding_ids: List[str] = []
-        holding_locations: List[str] = []
         holding_statuses: List[str] = []
         holding_errors: List[str] = []
-
-        item_ids: List[str] = []
         item_statuses: List[str] = []
         item_errors: List[str] = []
 
-        for loc in self.locations:
-            loc_code = loc.get("location") or ""
-            h_id = loc.get("holding_id") or ""
-            h_status = loc.get("holding_status") or ""
-            h_error = loc.get("holding_error") or ""
-            i_id = loc.get("item_id") or ""
-            i_status = loc.get("item_status") or ""
-            i_error = loc.get("item_error") or ""
-
-            if h_id:
-                holding_ids.append(h_id)
-            if loc_code:
-                holding_locations.append(loc_code)
+        # Une seule passe sur les colonnes préfixées par le code de localisation
+        for code, h_status, h_error, i_status, i_error in zip(
+            self.location_codes,
+            self.holding_statuses,
+            self.holding_errors,
+            self.item_statuses,
+            self.item_errors,
+        ):
             if h_status:
-                holding_statuses.append(f"{loc_code}:{h_status}")
+                holding_statuses.append(f"{code}:{h_status}")
             if h_error:
-                holding_errors.append(f"{loc_code}:{h_error}")
-
-            if i_id:
-                item_ids.append(i_id)
+                holding_errors.append(f"{code}:{h_error}")
             if i_status:
-                item_statuses.append(f"{loc_code}:{i_status}")
+                item_statuses.append(f"{code}:{i_status}")
             if i_error:
-                item_errors.append(f"{loc_code}:{i_error}")
-
-        def join_or_empty(values: List[str]) -> str:
-            return " | ".join(values) if values else ""
+                item_errors.append(f"{code}:{i_error}")
 
         return {
             "record_index": str(self.record_index),
@@ -1335,36 +1797,134 @@ class NoticeReport:
             "mms_id": self.mms_id or "",
             "bib_status": self.bib_status or "",
             "bib_error": self.bib_error or "",
-            "warnings": " | ".join(self.warnings) if self.warnings else "",
-            "holding_locations": join_or_empty(holding_locations),
-            "holding_ids": join_or_empty(holding_ids),
-            "holding_statuses": join_or_empty(holding_statuses),
-            "holding_errors": join_or_empty(holding_errors),
-            "item_ids": join_or_empty(item_ids),
-            "item_statuses": join_or_empty(item_statuses),
-            "item_errors": join_or_empty(item_errors),
+            # " | ".join([]) == "" : pas de cas particulier pour les listes vides
+            "warnings": " | ".join(self.warnings),
+            "holding_locations": " | ".join(holding_locations),
+            "holding_ids": " | ".join(holding_ids),
+            "holding_statuses": " | ".join(holding_statuses),
+            "holding_errors": " | ".join(holding_errors),
+            "item_ids": " | ".join(item_ids),
+            "item_statuses": " | ".join(item_statuses),
+            "item_errors": " | ".join(item_errors),
         }
 
 
+class CsvReportWriter:
+    """
+    Écrit le rapport CSV au fil du traitement : le fichier n'est créé qu'à
+    la première ligne et chaque ligne est flushée, le rapport partiel
+    survit donc à un arrêt du script.
+    """
+
+    def __init__(self, csv_path: Path) -> None:
+        self.csv_path = csv_path
+        self.rows_written = 0
+        self._file: Optional[io.TextIOWrapper] = None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, report: Optional[NoticeReport]) -> None:
+        """Ajoute la ligne d'une notice (None = notice sans rapport, ignorée)."""
+        if report is None:
+            return
+        if self._writer is None:
+            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.csv_path.open("w", newline="", encoding="utf-8")
+            # extrasaction="ignore" : pas de contrôle des clés en trop à chaque ligne
+            self._writer = csv.DictWriter(
+                self._file, fieldnames=REPORT_FIELDNAMES, delimiter=";", extrasaction="ignore"
+            )
+            self._writer.writeheader()
+        self._writer.writerow(report.to_csv_row())
+        self._file.flush()
+        self.rows_written += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "CsvReportWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
 # =============================================================================
 # CONFIG HOLDING/ITEM VIA FICHIER INI
 # =============================================================================
 
-def load_config(
-    config_file: Optional[str],
-    logger: logging.Logger,
-) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+INI_BOOLEAN_STATES = MappingProxyType({
+    "1": True, "yes": True, "true": True, "on": True,
+    "0": False, "no": False, "false": False, "off": False,
+})
+
+
+class IniParseError(ValueError):
+    """Fichier INI mal formé (section manquante, ligne sans '=', doublon)."""
+
+
+def parse_ini(text: str) -> Dict[str, Dict[str, str]]:
     """
-    Charge la configuration globale depuis un fichier INI.
+    Parse un petit fichier INI en {section: {clé: valeur}}.
 
-    Retourne 5 dicts :
-      - general_cfg
-      - infoscience_cfg
-      - xsd_cfg
-      - holding_info
-      - item_info
+    Même lecture que configparser.ConfigParser pour ce qui est utilisé ici :
+    commentaires '#' / ';' en début de ligne, séparateurs '=' ou ':',
+    clés en minuscules, valeurs sans espaces autour, lignes indentées
+    ajoutées à la valeur précédente. Pas d'interpolation.
     """
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    last_key: Optional[str] = None
+
+    for lineno, raw in enumerate(text.splitlines(), start=1):
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+
+        if raw[0].isspace() and current is not None and last_key is not None:
+            current[last_key] = f"{current[last_key]}\n{line}"
+            continue
+
+        if line[0] == "[" and line[-1] == "]":
+            name = line[1:-1]
+            if name in sections:
+                raise IniParseError(f"ligne {lineno} : section [{name}] en double")
+            current = sections[name] = {}
+            last_key = None
+            continue
+
+        if current is None:
+            raise IniParseError(f"ligne {lineno} : clé hors de toute section")
+
+        eq = line.find("=")
+        colon = line.find(":")
+        if eq < 0 and colon < 0:
+            raise IniParseError(f"ligne {lineno} : '=' manquant ({line!r})")
+        sep = colon if eq < 0 or 0 <= colon < eq else eq
 
+        key = line[:sep].strip().lower()
+        if key in current:
+            raise IniParseError(f"ligne {lineno} : clé '{key}' en double")
+        current[key] = line[sep + 1:].strip()
+        last_key = key
+
+    return sections
+
+
+def as_bool(value: str) -> bool:
+    """Convertit une valeur INI en bool (mêmes valeurs que ConfigParser.getboolean)."""
+    try:
+        return INI_BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
+
+def default_config() -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Retourne la configuration par défaut (nouveaux dicts à chaque appel) :
+    general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info.
+    """
     # Valeurs par défaut (fallback si le INI ne les définit pas)
     general_cfg: Dict[str, Any] = {
         "env": "S",
@@ -1373,6 +1933,7 @@ def load_config(
         "report_prefix": "rapport_",
         "skip_sru_check": False,
         "log_level": "INFO",
+        "workers": 1,
     }
 
     infoscience_cfg: Dict[str, Any] = {
@@ -1401,32 +1962,26 @@ def load_config(
         "material_type_code": "THESIS",
     }
 
-    if not config_file:
-        logger.info("Aucun fichier de config fourni, utilisation des valeurs par défaut.")
-        return general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info
+    return general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info
 
-    cfg_path = Path(config_file)
-    if not cfg_path.exists():
-        logger.warning(
-            "Fichier de configuration %s introuvable, utilisation des valeurs par défaut.",
-            cfg_path,
-        )
-        return general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info
 
-    parser = configparser.ConfigParser()
-    try:
-        parser.read(cfg_path, encoding="utf-8")
-    except Exception as e:
-        logger.warning(
-            "Erreur lors de la lecture de %s : %s. Utilisation des valeurs par défaut.",
-            cfg_path,
-            e,
-        )
-        return general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info
+@lru_cache(maxsize=4)
+def load_config_cached(
+    config_path: str,
+    mtime_ns: int,
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Parse le fichier INI et applique ses valeurs sur la configuration par
+    défaut. Mis en cache par (chemin, date de modification en ns) : le résultat
+    est partagé, les appelants doivent travailler sur une copie.
+    """
+    general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info = default_config()
+
+    sections = parse_ini(Path(config_path).read_text(encoding="utf-8"))
 
     # [general]
-    if parser.has_section("general"):
-        sec = parser["general"]
+    sec = sections.get("general")
+    if sec is not None:
         if "env" in sec:
             general_cfg["env"] = sec.get("env", general_cfg["env"])
         if "institution_code" in sec:
@@ -1434,28 +1989,24 @@ def load_config(
                 "institution_code", general_cfg["institution_code"]
             )
         if "check_xsd" in sec:
-            general_cfg["check_xsd"] = sec.getboolean(
-                "check_xsd", fallback=general_cfg["check_xsd"]
-            )
+            general_cfg["check_xsd"] = as_bool(sec["check_xsd"])
         if "report_prefix" in sec:
             general_cfg["report_prefix"] = sec.get(
                 "report_prefix", general_cfg["report_prefix"]
             )
         if "skip_sru_check" in sec:
-            general_cfg["skip_sru_check"] = sec.getboolean(
-                "skip_sru_check", fallback=general_cfg["skip_sru_check"]
-            )
+            general_cfg["skip_sru_check"] = as_bool(sec["skip_sru_check"])
         if "log_level" in sec:
             general_cfg["log_level"] = sec.get("log_level", general_cfg["log_level"]).upper()
+        if "workers" in sec:
+            general_cfg["workers"] = int(sec["workers"])
 
 
     # [infoscience]
-    if parser.has_section("infoscience"):
-        sec = parser["infoscience"]
+    sec = sections.get("infoscience")
+    if sec is not None:
         if "spc_rpp" in sec:
-            infoscience_cfg["spc_rpp"] = sec.getint(
-                "spc_rpp", fallback=infoscience_cfg["spc_rpp"]
-            )
+            infoscience_cfg["spc_rpp"] = int(sec["spc_rpp"])
         if "of_format" in sec:
             infoscience_cfg["of_format"] = sec.get(
                 "of_format", infoscience_cfg["of_format"]
@@ -1466,15 +2017,15 @@ def load_config(
             )
 
     # [xsd]
-    if parser.has_section("xsd"):
-        sec = parser["xsd"]
+    sec = sections.get("xsd")
+    if sec is not None:
         for key in ["marc21", "bib", "holding", "item"]:
             if key in sec:
                 xsd_cfg[key] = sec.get(key, xsd_cfg[key])
 
     # [holding]
-    if parser.has_section("holding"):
-        sec = parser["holding"]
+    sec = sections.get("holding")
+    if sec is not None:
         if "library_code" in sec:
             holding_info["library_code"] = sec.get(
                 "library_code", holding_info["library_code"]
@@ -1490,8 +2041,8 @@ def load_config(
             )
 
     # [item]
-    if parser.has_section("item"):
-        sec = parser["item"]
+    sec = sections.get("item")
+    if sec is not None:
         if "po_line" in sec:
             val = sec.get("po_line", "").strip()
             item_info["po_line"] = val or None
@@ -1508,16 +2059,564 @@ def load_config(
                 "department_code", item_info["department_code"]
         )
 
-    logger.info(
-        "Configuration chargée depuis %s : general=%s, infoscience=%s, holding=%s, item=%s",
-        cfg_path,
-        general_cfg,
-        infoscience_cfg,
-        holding_info,
-        item_info,
-    )
     return general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info
 
+
+def load_config(
+    config_file: Optional[str],
+    logger: Optional[logging.Logger],
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Charge la configuration globale depuis un fichier INI.
+
+    Retourne 5 dicts :
+      - general_cfg
+      - infoscience_cfg
+      - xsd_cfg
+      - holding_info
+      - item_info
+
+    Le fichier n'est re-parsé que s'il a été modifié depuis le dernier
+    chargement ; les dicts retournés sont des copies modifiables.
+    logger=None : chargement sans aucun log (avant la configuration du logging).
+    """
+    if not config_file:
+        if logger is not None:
+            logger.info("Aucun fichier de config fourni, utilisation des valeurs par défaut.")
+        return default_config()
+
+    cfg_path = Path(config_file)
+    try:
+        mtime_ns = cfg_path.stat().st_mtime_ns
+    except OSError:
+        if logger is not None:
+            logger.warning(
+                "Fichier de configuration %s introuvable, utilisation des valeurs par défaut.",
+                cfg_path,
+            )
+        return default_config()
+
+    try:
+        cached = load_config_cached(str(cfg_path), mtime_ns)
+    except (IniParseError, UnicodeDecodeError, OSError) as e:
+        if logger is not None:
+            logger.warning(
+                "Erreur lors de la lecture de %s : %s. Utilisation des valeurs par défaut.",
+                cfg_path,
+                e,
+            )
+        return default_config()
+
+    general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info = copy.deepcopy(cached)
+
+    if logger is not None and logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Configuration chargée depuis %s : general=%s, infoscience=%s, holding=%s, item=%s",
+            cfg_path,
+            general_cfg,
+            infoscience_cfg,
+            holding_info,
+            item_info,
+        )
+    return general_cfg, infoscience_cfg, xsd_cfg, holding_info, item_info
+
+# =============================================================================
+# TRAITEMENT D'UNE NOTICE
+# =============================================================================
+
+
+def persist_call_number(value: int, path: Path = Path(LAST_CALL_NUMBER_FILE)) -> None:
+    """
+    Écrit la dernière cote utilisée de façon atomique : fichier temporaire
+    puis os.replace, le fichier n'est donc jamais lu à moitié écrit.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(str(value), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class CallNumberAllocator:
+    """
+    Distribue les cotes successives ("<préfixe> <numéro>") ; sûr en cas
+    d'appels concurrents (plusieurs notices traitées en parallèle). Chaque
+    cote attribuée est aussitôt enregistrée, un arrêt en cours de run ne la
+    perd donc pas.
+    """
+
+    def __init__(self, last_value: int, prefix: str, logger: logging.Logger) -> None:
+        self.last_value = last_value
+        # Préfixe + espace, concaténé tel quel à chaque cote
+        self.prefix = f"{prefix} "
+        self.logger = logger
+        self._lock = threading.Lock()
+
+    def next_call_number(self) -> str:
+        with self._lock:
+            self.last_value += 1
+            value = self.last_value
+            try:
+                persist_call_number(value)
+            except OSError as e:
+                self.logger.warning("Impossible d'écrire %s : %s", LAST_CALL_NUMBER_FILE, e)
+        return self.prefix + str(value)
+
+
+@dataclass
+class RecordContext:
+    """Paramètres partagés par le traitement de toutes les notices d'un run."""
+
+    logger: logging.Logger
+    dry_run: bool
+    check_xsd: bool
+    skip_sru_check: bool
+    sru_verbose: bool
+    env: str
+    institution_code: str
+    holding_info: Dict[str, Any]
+    item_info: Dict[str, Any]
+    call_numbers: CallNumberAllocator
+    # Date du run, calculée une fois (008 des holdings, arrival_date des items)
+    run_date: date
+    arrival_date: str
+    marc_schema: Optional[etree.XMLSchema] = None
+    bib_schema: Optional[etree.XMLSchema] = None
+    bib_record_schema: Optional[etree.XMLSchema] = None
+    holding_schema: Optional[etree.XMLSchema] = None
+    item_schema: Optional[etree.XMLSchema] = None
+    # Pool dédié aux holdings/items d'une même notice (None = séquentiel)
+    location_executor: Optional[ThreadPoolExecutor] = None
+
+
+def iter_numbered_records(
+    records: Iterable[Record],
+    max_records: int,
+    logger: logging.Logger,
+) -> Iterable[Tuple[int, Record]]:
+    """
+    Numérote les notices à partir de 1 et s'arrête après max_records
+    (0 = pas de limite).
+    """
+    for record_index, record in enumerate(records, start=1):
+        if max_records > 0 and record_index > max_records:
+            logger.info(
+                "max_records=%d atteint, arrêt du traitement des notices.",
+                max_records,
+            )
+            return
+        yield record_index, record
+
+
+def create_location_inventory(
+    bib_obj: IzBib,
+    loc: str,
+    call_number: str,
+    ctx: RecordContext,
+    holdings: Optional[List[Holding]] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    Crée (ou récupère) la holding d'une localisation puis son item.
+    holdings : holdings existantes de la notice, lues avant la répartition
+    par localisation (les threads ne touchent pas à l'état de bib_obj).
+
+    Retourne les colonnes du rapport pour cette localisation
+    (arguments de NoticeReport.add_location).
+    """
+    logger = ctx.logger
+    item_info = ctx.item_info
+    library_code = ctx.holding_info["library_code"]
+
+    try:
+        holding = creer_holding(
+            bib_obj=bib_obj,
+            library_code=library_code,
+            location=loc,
+            call_number=call_number,
+            holding_schema=ctx.holding_schema,
+            zone=ctx.institution_code,
+            env=ctx.env,
+            logger=logger,
+            run_date=ctx.run_date,
+            holdings=holdings,
+        )
+
+        if holding:
+            logger.info(
+                "Holding créée ou récupérée pour location %s, ID %s",
+                loc,
+                holding.get_holding_id(),
+            )
+
+            item_id = creer_item_pour_une_holding(
+                holding=holding,
+                po_line=item_info["po_line"],
+                work_order_type=item_info.get("work_order_type"),
+                department_code=item_info.get("department_code"),
+                material_type_code=item_info["material_type_code"],
+                item_schema=ctx.item_schema,
+                zone=ctx.institution_code,
+                env=ctx.env,
+                logger=logger,
+                arrival_date=ctx.arrival_date,
+            )
+
+            if item_id:
+                logger.info(
+                    "Item créé pour location %s, item_id=%s",
+                    loc,
+                    item_id,
+                )
+                return dict(
+                    location=loc,
+                    holding_id=str(holding.get_holding_id()),
+                    holding_status="CREATED",
+                    item_id=str(item_id),
+                    item_status="CREATED",
+                )
+            else:
+                logger.error(
+                    "Création de l'item échouée pour holding %s (%s).",
+                    holding.holding_id,
+                    loc,
+                )
+                return dict(
+                    location=loc,
+                    holding_id=str(holding.get_holding_id()),
+                    holding_status="CREATED",
+                    item_status="ERROR",
+                    item_error="Item creation failed (see logs)",
+                )
+
+        else:
+            logger.error(
+                "Impossible de créer la holding pour location %s -> aucun item créé.",
+                loc,
+            )
+            return dict(
+                location=loc,
+                holding_status="ERROR",
+                holding_error="Holding creation failed (see logs)",
+                item_status="SKIPPED",
+            )
+
+    except Exception as e:
+        handle_error(
+            f"❌ Erreur lors de la création de la holding {safe(library_code)}",
+            exc=e,
+            stop=False,
+        )
+        return dict(
+            location=loc,
+            holding_status="ERROR",
+            holding_error=str(e),
+            item_status="SKIPPED",
+        )
+
+
+@dataclass
+class PreparedRecord:
+    """Notice source et données qui en sont dérivées, calculées sans appel réseau."""
+
+    record_index: int
+    record: Record
+    current_record: Record
+    info: Dict[str, Any]
+    year_fallback: bool
+
+
+def prepare_record(
+    record: Record,
+    record_index: int,
+    logger: logging.Logger,
+) -> Optional[PreparedRecord]:
+    """
+    Partie CPU du traitement d'une notice : record MARC final et infos
+    pour la recherche SRU. Retourne None si la notice est inexploitable.
+    """
+    logger.info("Traitement de la notice n°%d", record_index)
+
+    # Notice vide (ex. <record/> sans champ) : rien à construire, pas d'exception à lever
+    if not is_buildable(record):
+        logger.warning(
+            "Notice %d sans aucun champ MARC --> Passage au record suivant",
+            record_index,
+        )
+        return None
+
+    # Construction du record MARC final (pour extractions & debug)
+    try:
+        current_record = build_final_record(record)
+        # Détection du fallback année (260$c et 502$d vides)
+        year_fallback = not extract_year(fget(record, "260", "c")) and not extract_year(
+            fget(record, "502", "d")
+        )
+        logger.info("Construction du record %d réussie", record_index)
+    except Exception:
+        logger.exception(
+            "Erreur lors de la construction du record %d --> Passage au record suivant",
+            record_index,
+        )
+        return None
+
+    # Extraction des infos pour la recherche SRU
+    try:
+        info_marc_current_record = extract_marc_info(current_record)
+        logger.info(
+            "Récupération du 'title', 'author', 'responsibility' réussie",
+        )
+    except Exception:
+        logger.exception(
+            "Problème lors de la récupération du 'title', 'author', 'responsibility' "
+            "du record %d --> La vérification dans SRU ne sera pas possible. Passage au record suivant",
+            record_index,
+        )
+        return None
+
+    return PreparedRecord(
+        record_index=record_index,
+        record=record,
+        current_record=current_record,
+        info=info_marc_current_record,
+        year_fallback=year_fallback,
+    )
+
+
+def process_record(
+    record: Record,
+    record_index: int,
+    ctx: RecordContext,
+) -> Optional[NoticeReport]:
+    """
+    Traite une notice Infoscience de bout en bout : vérification SRU,
+    construction et validation du <bib>, création Bib/holdings/items.
+
+    Retourne le NoticeReport de la notice, ou None si elle a été abandonnée
+    avant de pouvoir figurer dans le rapport.
+    """
+    prepared = prepare_record(record, record_index, ctx.logger)
+    if prepared is None:
+        return None
+    return process_prepared_record(prepared, ctx)
+
+
+def process_prepared_record(
+    prepared: PreparedRecord,
+    ctx: RecordContext,
+) -> Optional[NoticeReport]:
+    """
+    Suite du traitement d'une notice préparée (voir prepare_record) :
+    vérification SRU, <bib>, création Bib/holdings/items.
+    """
+    logger = ctx.logger
+    holding_info = ctx.holding_info
+    record = prepared.record
+    record_index = prepared.record_index
+    year_fallback = prepared.year_fallback
+
+    # Champs extraits une seule fois (log, rapport et requête SRU)
+    info_marc_current_record = prepared.info
+    title = info_marc_current_record["title"]
+    author = info_marc_current_record["author"]
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Recherche SRU title=%s author=%s responsibility=%s",
+            safe(title),
+            safe(author),
+            safe(info_marc_current_record["responsibility"]),
+        )
+
+    notice_report = NoticeReport(
+        record_index=record_index,
+        infoscience_id=info_marc_current_record["infoscience_id"],
+        title=title,
+        author=author,
+        call_number=None,
+    )
+
+    if year_fallback:
+        msg = "Publication year missing (260$c / 502$d) → fallback to current year used in 008"
+        logger.warning("Record %d: %s", record_index, msg)
+        notice_report.add_warning(msg)
+
+    if ctx.skip_sru_check:
+        logger.info("Vérification SRU ignorée (--skip-sru-check activé).")
+        notice_report.sru_exists = None
+        exists = False
+    else:
+        # Vérifie si l'enregistrement existe déjà dans SRU
+        try:
+            exists = sru_record_exists(
+                title or "",
+                author or "",
+                institution_code=ctx.institution_code,
+                verbose=ctx.sru_verbose,
+            )
+            notice_report.sru_exists = exists
+        except Exception:
+            logger.exception(
+                "Erreur lors de la recherche SRU pour le record %d --> Passage au record suivant",
+                record_index,
+            )
+            return None
+
+    if exists:
+        logger.info("Notice déjà présente dans Alma, création ignorée.")
+        notice_report.bib_status = "SKIPPED_SRU_EXISTS"
+        notice_report.call_number = "N/A"
+        notice_report.add_warning(
+           "Record already exists in SRU: call number not assigned"
+        )
+        return notice_report
+
+    logger.info("Pas présent dans SRU, préparation de la notice.")
+
+    call_number_str = ctx.call_numbers.next_call_number()
+    notice_report.call_number = call_number_str
+    # 1) Construire <bib> + <record> à partir de la notice source
+    try:
+        # Le record final a déjà été construit par prepare_record
+        rec_el, bib_el = build_bib_with_record(record, final_record=prepared.current_record)
+        logger.info("Élément <bib> construit, lancement éventuel de la validation XSD.")
+    except Exception:
+        logger.exception(
+            "Problème lors de la préparation de la notice pour le record %d --> Passage au record suivant",
+            record_index,
+        )
+        return None
+
+    # 2) Validation XSD Bib + Record
+    schema_bib_and_record_valid = True
+    if ctx.check_xsd:
+        logger.info(
+            "Validation XSD Bib + Record activée pour le record %d.",
+            record_index,
+        )
+
+        try:
+            result = validate_bib_and_record(
+                bib_element=bib_el,
+                marc_schema=ctx.marc_schema,
+                bib_schema=ctx.bib_schema,
+                bib_record_schema=ctx.bib_record_schema,
+            )
+        except Exception:
+            logger.exception(
+                "Problème avec la fonction validate_bib_and_record pour le record %d.",
+                record_index,
+            )
+            schema_bib_and_record_valid = False
+        else:
+            record_valid = result["record_valid"]
+            bib_valid = result["bib_valid"]
+
+            if not record_valid:
+                logger.error("Validation MARC record KO pour le record %d", record_index)
+                for err in result["record_errors"]:
+                    logger.error("  - %s", err)
+
+            if not bib_valid:
+                logger.error("Validation Bib KO pour le record %d", record_index)
+                for err in result["bib_errors"]:
+                    logger.error("  - %s", err)
+
+            schema_bib_and_record_valid = record_valid and bib_valid
+
+            if schema_bib_and_record_valid:
+                logger.info(
+                    "Vérification des schémas Bib et Record correcte pour le record %d.",
+                    record_index,
+                )
+            else:
+                logger.error(
+                    "Problème de validation des schémas Bib et/ou Record pour le record %d.",
+                    record_index,
+                )
+    else:
+        logger.info("Validation XSD désactivée (check_xsd = False).")
+
+    if not schema_bib_and_record_valid:
+        logger.error(
+            "Schémas Bib/Record non valides pour le record %d --> Passage au record suivant",
+            record_index,
+        )
+        notice_report.bib_status = "XSD_ERROR"
+        notice_report.bib_error = "Bib/Record XSD validation failed (see logs)"
+        return notice_report
+
+    # DRY-RUN : on ne crée rien dans Alma, mais on affiche ce qui serait envoyé
+    if ctx.dry_run:
+        logger.info(
+            "DRY-RUN: BIB/holdings/items NON créés pour le record %d (tout est valide jusqu'ici).",
+            record_index,
+        )
+        # Sérialisations coûteuses : seulement si le niveau INFO est actif
+        if logger.isEnabledFor(logging.INFO):
+            # Affiche le MARCXML final (record) qui serait envoyé à Alma
+            logger.info(
+                "DRY-RUN MARCXML (record %d):\n%s",
+                record_index,
+                etree.tostring(rec_el, pretty_print=True, encoding="unicode"),
+            )
+
+            # Affichage du <bib> Alma complet
+            logger.info(
+                "DRY-RUN Alma <bib> (record %d):\n%s",
+                record_index,
+                etree.tostring(bib_el, pretty_print=True, encoding="unicode"),
+            )
+
+        notice_report.bib_status = "DRY_RUN_OK"
+        notice_report.bib_error = ""
+        return notice_report
+
+    # 3) Création de la notice Bib dans Alma
+    logger.info("Les schémas Bib et Record sont corrects. --> Création de la notice Bib.")
+    from almapiwrapper.inventory import IzBib
+
+    try:
+        bib_obj = IzBib(
+            data=as_xml_data(bib_el),
+            zone=ctx.institution_code,
+            env=ctx.env,
+            create_bib=True,
+        )
+        logger.info("✅ Notice créée avec succès. MMS ID : %s", bib_obj.get_mms_id())
+        notice_report.mms_id = str(bib_obj.get_mms_id())
+        notice_report.bib_status = "CREATED"
+    except Exception as e:
+        handle_error(
+            "❌ Erreur lors de la création de la notice Bib",
+            exc=e,
+            stop=False,
+        )
+        notice_report.bib_status = "ERROR"
+        notice_report.bib_error = str(e)
+        return notice_report
+
+    # 4) Création des holdings + items, en parallèle par localisation si possible.
+    # Holdings existantes lues une fois, ici : get_holdings() modifie bib_obj
+    # en place et ne doit pas être appelé depuis plusieurs threads.
+    locations = holding_info["locations"]
+    if ctx.location_executor is not None and len(locations) > 1:
+        holdings = fetch_holdings(bib_obj)
+        location_results = ctx.location_executor.map(
+            lambda loc: create_location_inventory(
+                bib_obj, loc, call_number_str, ctx, holdings=holdings
+            ),
+            locations,
+        )
+    else:
+        location_results = (
+            create_location_inventory(bib_obj, loc, call_number_str, ctx) for loc in locations
+        )
+
+    # Rapport dans l'ordre des localisations de la config
+    for location_result in location_results:
+        notice_report.add_location(**location_result)
+
+    return notice_report
+
+
 # =============================================================================
 # MAIN PIPELINE
 # =============================================================================
@@ -1535,7 +2634,20 @@ def main(
     config_file: Optional[str] = None,
     ref_date: Optional[date] = None,
     skip_sru_check: bool = False,
-) -> None:
+    workers: Optional[int] = None,
+    min_call_number: Optional[int] = None,
+    report_suffix: str = "",
+) -> int:
+    """
+    Lance un run complet et retourne la dernière cote attribuée.
+
+    min_call_number : plancher de cote (mode --batch-file), au cas où
+    Analytics ne refléterait pas encore les cotes du job précédent.
+    report_suffix : ajouté au nom du rapport CSV, un rapport par job.
+    """
+    # Date du run : calculée une seule fois, réutilisée pour chaque holding/item
+    run_date = date.today()
+
     # 1) logger bootstrap (INFO)
     logger = get_logger(console_level=logging.INFO)
 
@@ -1551,7 +2663,7 @@ def main(
 
     logger.info(
         "Début du script. %s (dry_run=%s, use_static_url=%s, env=%s, inst=%s, spc_page=%d, "
-        "spc_rpp=%d, check_xsd=%s, skip_sru_check=%s, max_records=%d, config_file=%s)",
+        "spc_rpp=%d, check_xsd=%s, skip_sru_check=%s, max_records=%d, workers=%s, config_file=%s)",
         datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         dry_run,
         use_static_url,
@@ -1562,6 +2674,7 @@ def main(
         check_xsd,
         skip_sru_check,
         max_records,
+        workers,
         config_file,
     )
 
@@ -1579,8 +2692,11 @@ def main(
     check_xsd = check_xsd and general_cfg["check_xsd"]
     # skip_sru_check : config INI + override par les arguments CLI
     skip_sru_check = skip_sru_check or general_cfg["skip_sru_check"]
+    # workers : nombre de notices traitées en parallèle (1 = séquentiel)
+    if workers is None:
+        workers = general_cfg["workers"]
 
-    # spc_rpp : si l’argument CLI est laissé par défaut, tu peux décider qui gagne :
+    # spc_rpp : valeur de la config si non renseignée (déjà résolue par parse_args en CLI)
     if spc_rpp <= 0:
         spc_rpp = infoscience_cfg["spc_rpp"]
 
@@ -1611,24 +2727,56 @@ def main(
             stop=True,
         )
 
+    last_call_number = int(current_call_number)
+    if min_call_number is not None and min_call_number > last_call_number:
+        logger.info(
+            "Cote Analytics %d antérieure à la dernière cote attribuée %d, reprise à %d.",
+            last_call_number,
+            min_call_number,
+            min_call_number,
+        )
+        last_call_number = min_call_number
+
     # 2) Chargement des schémas XSD si nécessaire
     marc_schema: Optional[etree.XMLSchema] = None
     bib_schema: Optional[etree.XMLSchema] = None
+    bib_record_schema: Optional[etree.XMLSchema] = None
     holding_schema: Optional[etree.XMLSchema] = None
     item_schema: Optional[etree.XMLSchema] = None
 
     if check_xsd:
         marc_schema = load_xml_schema(xsd_cfg["marc21"])
         bib_schema = load_xml_schema(xsd_cfg["bib"])
+        if marc_schema is not None and bib_schema is not None:
+            bib_record_schema = load_bib_record_schema(xsd_cfg["marc21"], xsd_cfg["bib"])
         holding_schema = load_xml_schema(xsd_cfg["holding"])
         item_schema = load_xml_schema(xsd_cfg["item"])
         logger.info("Schémas XSD chargés avec succès")
 
-    record_index = 0
-    reports: List[NoticeReport] = []
-
     # 3+4) Récupérer toutes les notices avec pagination spc.page
-    call_number_value = int(current_call_number)
+    call_numbers = CallNumberAllocator(
+        last_call_number, holding_info["call_number_prefix"], logger
+    )
+
+    ctx = RecordContext(
+        logger=logger,
+        dry_run=dry_run,
+        check_xsd=check_xsd,
+        skip_sru_check=skip_sru_check,
+        sru_verbose=log_level <= logging.DEBUG,
+        env=env,
+        institution_code=institution_code,
+        holding_info=holding_info,
+        item_info=item_info,
+        call_numbers=call_numbers,
+        run_date=run_date,
+        arrival_date=run_date.isoformat(),
+        marc_schema=marc_schema,
+        bib_schema=bib_schema,
+        bib_record_schema=bib_record_schema,
+        holding_schema=holding_schema,
+        item_schema=item_schema,
+    )
 
     records_iter = iter_infoscience_records(
         use_static_url=use_static_url,
@@ -1638,356 +2786,134 @@ def main(
         ref=ref_date,
         of_format=of_format,
     )
+    numbered_records = iter_numbered_records(records_iter, max_records, logger)
+
+    # 5) Pour chaque notice (toutes pages confondues), rapport CSV écrit au fil de l'eau
+    csv_path = Path(REPORT_DIR) / f"{general_cfg['report_prefix']}{TODAY}{report_suffix}.csv"
+    with CsvReportWriter(csv_path) as report_writer:
+        if workers <= 1:
+            # Notices traitées une à une : le log se lit notice par notice
+            for record_index, record in numbered_records:
+                report_writer.write(process_record(record, record_index, ctx))
+        else:
+            # Les notices sont indépendantes : leurs appels SRU/Alma se recouvrent.
+            # La fenêtre bornée limite les notices en vol (lecture Infoscience
+            # comprise) et les résultats sont écrits dans l'ordre des notices.
+            # Un second pool crée en parallèle les holdings/items des localisations
+            # d'une notice (pool séparé : les tâches "record" attendent ses résultats).
+            window: Deque[Future] = deque()
+            with (
+                ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="location"
+                ) as location_executor,
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="record") as executor,
+            ):
+                ctx.location_executor = location_executor
+                for record_index, record in numbered_records:
+                    if len(window) >= workers * 2:
+                        report_writer.write(window.popleft().result())
+                    window.append(executor.submit(process_record, record, record_index, ctx))
+
+                while window:
+                    report_writer.write(window.popleft().result())
+
+    if report_writer.rows_written:
+        logger.info("Rapport CSV écrit dans %s", csv_path.resolve())
+    else:
+        logger.info("Aucun rapport à écrire (aucune notice traitée).")
 
-    # 5) Pour chaque notice (toutes pages confondues)
-    for record in records_iter:
-        record_index += 1
-        if max_records > 0 and record_index > max_records:
-            logger.info(
-                "max_records=%d atteint, arrêt du traitement des notices.",
-                max_records,
-            )
-            break
-
-        logger.info("Traitement de la notice n°%d", record_index)
-
-        # Construction du record MARC final (pour extractions & debug)
-        try:
-            current_record = build_final_record(record)
-            # Détection du fallback année (260$c et 502$d vides)
-            if not extract_year(fget(record, "260", "c")) and not extract_year(fget(record, "502", "d")):
-                msg = "Publication year missing (260$c / 502$d) → fallback to current year used in 008"
-                logger.warning("Record %d: %s", record_index, msg)
-                notice_report.add_warning(msg)
-            logger.info("Construction du record %d réussie", record_index)
-        except Exception:
-            logger.exception(
-                "Erreur lors de la construction du record %d --> Passage au record suivant",
-                record_index,
-            )
-            continue
-
-        # Extraction des infos pour la recherche SRU
-        try:
-            info_marc_current_record = extract_marc_info(current_record)
-            logger.info(
-                "Récupération du 'title', 'author', 'responsibility' réussie",
-            )
-        except Exception:
-            logger.exception(
-                "Problème lors de la récupération du 'title', 'author', 'responsibility' "
-                "du record %d --> La vérification dans SRU ne sera pas possible. Passage au record suivant",
-                record_index,
-            )
-            continue
-
+    # 6) Sauvegarde info : dernière cote utilisée (sans fallback)
+    try:
+        persist_call_number(call_numbers.last_value)
         logger.info(
-            "Recherche SRU title=%s author=%s responsibility=%s",
-            safe(info_marc_current_record.get("title")),
-            safe(info_marc_current_record.get("author")),
-            safe(info_marc_current_record.get("responsibility")),
-        )
-
-        notice_report = NoticeReport(
-            record_index=record_index,
-            infoscience_id=info_marc_current_record.get("infoscience_id"),
-            title=info_marc_current_record.get("title"),
-            author=info_marc_current_record.get("author"),
-            call_number=None,
+            "Dernière cote utilisée enregistrée dans %s", Path(LAST_CALL_NUMBER_FILE).resolve()
         )
+    except Exception as e:
+        logger.warning("Impossible d'écrire %s : %s", LAST_CALL_NUMBER_FILE, e)
 
-        if skip_sru_check:
-            logger.info("Vérification SRU ignorée (--skip-sru-check activé).")
-            notice_report.sru_exists = None
-            exists = False
-        else:
-            # Vérifie si l'enregistrement existe déjà dans SRU
-            try:
-                exists = fetch_marc_record_from_sru(
-                    info_marc_current_record["title"] or "",
-                    info_marc_current_record["author"] or "",
-                    institution_code=institution_code,
-                )
-                notice_report.sru_exists = exists
-            except Exception:
-                logger.exception(
-                    "Erreur lors de la recherche SRU pour le record %d --> Passage au record suivant",
-                    record_index,
-                )
-                continue
-
-        if exists:
-            logger.info("Notice déjà présente dans Alma, création ignorée.")
-            notice_report.bib_status = "SKIPPED_SRU_EXISTS"
-            notice_report.call_number = "N/A"
-            notice_report.add_warning(
-               "Record already exists in SRU: call number not assigned"
-            )
-            reports.append(notice_report)
-            continue
-
-        logger.info("Pas présent dans SRU, préparation de la notice.")
-
-        call_number_value += 1
-        call_number_str = f"{holding_info['call_number_prefix']} {call_number_value}"
-        notice_report.call_number = call_number_str
-        # 1) Construire <bib> + <record> à partir de la notice source
-        try:
-            rec_el, bib_el = build_bib_with_record(record)
-            logger.info("Élément <bib> construit, lancement éventuel de la validation XSD.")
-        except Exception:
-            logger.exception(
-                "Problème lors de la préparation de la notice pour le record %d --> Passage au record suivant",
-                record_index,
-            )
-            continue
-
-        # 2) Validation XSD Bib + Record
-        schema_bib_and_record_valid = True
-        if check_xsd:
-            logger.info(
-                "Validation XSD Bib + Record activée pour le record %d.",
-                record_index,
-            )
-
-            try:
-                result = validate_bib_and_record(
-                    bib_element=bib_el,
-                    marc_schema=marc_schema,
-                    bib_schema=bib_schema,
-                )
-            except Exception:
-                logger.exception(
-                    "Problème avec la fonction validate_bib_and_record pour le record %d.",
-                    record_index,
-                )
-                schema_bib_and_record_valid = False
-            else:
-                record_valid = result["record_valid"]
-                bib_valid = result["bib_valid"]
-
-                if not record_valid:
-                    logger.error("Validation MARC record KO pour le record %d", record_index)
-                    for err in result["record_errors"]:
-                        logger.error("  - %s", err)
-
-                if not bib_valid:
-                    logger.error("Validation Bib KO pour le record %d", record_index)
-                    for err in result["bib_errors"]:
-                        logger.error("  - %s", err)
-
-                schema_bib_and_record_valid = record_valid and bib_valid
-
-                if schema_bib_and_record_valid:
-                    logger.info(
-                        "Vérification des schémas Bib et Record correcte pour le record %d.",
-                        record_index,
-                    )
-                else:
-                    logger.error(
-                        "Problème de validation des schémas Bib et/ou Record pour le record %d.",
-                        record_index,
-                    )
-        else:
-            logger.info("Validation XSD désactivée (check_xsd = False).")
+    logger.info(
+        "Fin du script. %s",
+        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
 
-        if not schema_bib_and_record_valid:
-            logger.error(
-                "Schémas Bib/Record non valides pour le record %d --> Passage au record suivant",
-                record_index,
-            )
-            notice_report.bib_status = "XSD_ERROR"
-            notice_report.bib_error = "Bib/Record XSD validation failed (see logs)"
-            reports.append(notice_report)
-            continue
+    return call_numbers.last_value
 
-        # DRY-RUN : on ne crée rien dans Alma, mais on affiche ce qui serait envoyé
-        if dry_run:
-            logger.info(
-                "DRY-RUN: BIB/holdings/items NON créés pour le record %d (tout est valide jusqu'ici).",
-                record_index,
-            )
-            # Affiche le MARCXML final (record) qui serait envoyé à Alma
-            logger.info(
-                "DRY-RUN MARCXML (record %d):\n%s",
-                record_index,
-                etree.tostring(rec_el, pretty_print=True, encoding="unicode"),
-            )
 
-            # Affichage du <bib> Alma complet
-            logger.info(
-                "DRY-RUN Alma <bib> (record %d):\n%s",
-                record_index,
-                etree.tostring(bib_el, pretty_print=True, encoding="unicode"),
-            )
+# =============================================================================
+# MODE BATCH (--batch-file)
+# =============================================================================
 
-            notice_report.bib_status = "DRY_RUN_OK"
-            notice_report.bib_error = ""
-            reports.append(notice_report)
-            continue
+# Clés acceptées pour un job et type attendu (mêmes noms que les options CLI)
+BATCH_JOB_FIELDS = MappingProxyType({
+    "spc_page": int,
+    "spc_rpp": int,
+    "env": str,
+    "institution_code": str,
+    "since_date": str,
+    "max_records": int,
+})
 
-        # 3) Création de la notice Bib dans Alma
-        logger.info("Les schémas Bib et Record sont corrects. --> Création de la notice Bib.")
-        try:
-            bib_obj = IzBib(
-                data=bib_el,
-                zone=institution_code,
-                env=env,
-                create_bib=True,
-            )
-            logger.info("✅ Notice créée avec succès. MMS ID : %s", bib_obj.get_mms_id())
-            notice_report.mms_id = str(bib_obj.get_mms_id())
-            notice_report.bib_status = "CREATED"
-        except Exception as e:
-            handle_error(
-                "❌ Erreur lors de la création de la notice Bib",
-                exc=e,
-                stop=False,
-            )
-            notice_report.bib_status = "ERROR"
-            notice_report.bib_error = str(e)
-            reports.append(notice_report)
-            continue
 
-        # 4) Création des holdings + items
-        for loc in holding_info["locations"]:
+def read_batch_file(batch_path: str) -> List[Dict[str, Any]]:
+    """
+    Lit un fichier de jobs (JSON Lines) : un objet par ligne, dont les clés
+    surchargent les options CLI pour ce job, ex.
+        {"spc_page": 1, "spc_rpp": 50, "env": "S", "institution_code": "HPH"}
+    Lignes vides et commentaires (#) ignorés. Lève ValueError si une ligne
+    est invalide ; since_date est convertie en ref_date.
+    """
+    jobs: List[Dict[str, Any]] = []
+    with open(batch_path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
             try:
-                holding = creer_holding(
-                    bib_obj=bib_obj,
-                    library_code=holding_info["library_code"],
-                    location=loc,
-                    call_number=call_number_str,
-                    holding_schema=holding_schema,
-                    zone=institution_code,
-                    env=env,
-                    logger=logger,
-                )
-
-                if holding:
-                    logger.info(
-                        "Holding créée ou récupérée pour location %s, ID %s",
-                        loc,
-                        holding.get_holding_id(),
-                    )
-
-                    item_id = creer_item_pour_une_holding(
-                        holding=holding,
-                        po_line=item_info["po_line"],
-                        work_order_type=item_info.get("work_order_type"),
-                        department_code=item_info.get("department_code"),
-                        material_type_code=item_info["material_type_code"],
-                        item_schema=item_schema,
-                        zone=institution_code,
-                        env=env,
-                        logger=logger,
-                    )
-
-                    if item_id:
-                        logger.info(
-                            "Item créé pour location %s, item_id=%s",
-                            loc,
-                            item_id,
-                        )
-                        notice_report.add_location(
-                            location=loc,
-                            holding_id=str(holding.get_holding_id()),
-                            holding_status="CREATED",
-                            item_id=str(item_id),
-                            item_status="CREATED",
-                        )
-                    else:
-                        logger.error(
-                            "Création de l'item échouée pour holding %s (%s).",
-                            holding.holding_id,
-                            loc,
-                        )
-                        notice_report.add_location(
-                            location=loc,
-                            holding_id=str(holding.get_holding_id()),
-                            holding_status="CREATED",
-                            item_status="ERROR",
-                            item_error="Item creation failed (see logs)",
-                        )
-
-                else:
-                    logger.error(
-                        "Impossible de créer la holding pour location %s -> aucun item créé.",
-                        loc,
-                    )
-                    notice_report.add_location(
-                        location=loc,
-                        holding_status="ERROR",
-                        holding_error="Holding creation failed (see logs)",
-                        item_status="SKIPPED",
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"ligne {line_no} : JSON invalide ({e.msg})") from e
+            if not isinstance(job, dict):
+                raise ValueError(f"ligne {line_no} : objet JSON attendu")
+
+            for key, value in job.items():
+                expected = BATCH_JOB_FIELDS.get(key)
+                if expected is None:
+                    raise ValueError(f"ligne {line_no} : clé inconnue '{key}'")
+                if not isinstance(value, expected) or isinstance(value, bool):
+                    raise ValueError(
+                        f"ligne {line_no} : '{key}' doit être de type {expected.__name__}"
                     )
+            if job.get("env", ENV_CHOICES[0]) not in ENV_CHOICES:
+                raise ValueError(f"ligne {line_no} : env doit valoir {' ou '.join(ENV_CHOICES)}")
 
-            except Exception as e:
-                handle_error(
-                    f"❌ Erreur lors de la création de la holding {safe(holding_info.get('library_code'))}",
-                    exc=e,
-                    stop=False,
-                )
-                notice_report.add_location(
-                    location=loc,
-                    holding_status="ERROR",
-                    holding_error=str(e),
-                    item_status="SKIPPED",
-                )
+            since_date = job.pop("since_date", None)
+            if since_date is not None:
+                try:
+                    job["ref_date"] = datetime.strptime(since_date, "%Y-%m-%d").date()
+                except ValueError as e:
+                    raise ValueError(f"ligne {line_no} : since_date invalide ({since_date})") from e
+            jobs.append(job)
+    return jobs
 
-        reports.append(notice_report)
-
-    # 6) Génération du rapport CSV
-    if reports:
-        rows = [rep.to_csv_row() for rep in reports]
-
-        fieldnames = [
-            "record_index",
-            "infoscience_id",
-            "title",
-            "author",
-            "call_number",
-            "sru_exists",
-            "mms_id",
-            "bib_status",
-            "bib_error",
-            "warnings",
-            "holding_locations",
-            "holding_ids",
-            "holding_statuses",
-            "holding_errors",
-            "item_ids",
-            "item_statuses",
-            "item_errors",
-        ]
 
-        report_filename = f"{general_cfg['report_prefix']}{TODAY}.csv"
-        report_dir = Path(REPORT_DIR)
-        report_dir.mkdir(parents=True, exist_ok=True)
-        csv_path = report_dir / report_filename
-        with csv_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=";")
-            writer.writeheader()
-            writer.writerows(rows)
-
-        logger.info("Rapport CSV écrit dans %s", csv_path.resolve())
-    else:
-        logger.info("Aucun rapport à écrire (aucune notice traitée).")
-
-    # 7) Sauvegarde info : dernière cote utilisée (sans fallback)
-    try:
-        last_call_path = Path("last_call_number.txt")
-        with last_call_path.open("w", encoding="utf-8") as f:
-            f.write(str(call_number_value))
-        logger.info(
-            "Dernière cote utilisée enregistrée dans %s", last_call_path.resolve()
+def run_batch(jobs: List[Dict[str, Any]], common_kwargs: Dict[str, Any]) -> None:
+    """
+    Enchaîne les jobs dans le même processus (imports, config et XSD en cache
+    réutilisés). La dernière cote d'un job sert de plancher au suivant et
+    chaque job écrit son propre rapport (suffixe _job<n>). Le cache SRU est
+    vidé avant chaque job : chaque run interroge SRU comme un run isolé.
+    """
+    last_call_number: Optional[int] = None
+    for job_number, job in enumerate(jobs, start=1):
+        clear_sru_cache()
+        last_call_number = main(
+            **{
+                **common_kwargs,
+                **job,
+                "min_call_number": last_call_number,
+                "report_suffix": f"_job{job_number}",
+            }
         )
-    except Exception as e:
-        logger.warning("Impossible d'écrire last_call_number.txt : %s", e)
-
-    logger.info(
-        "Fin du script. %s",
-        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    )
 
 
 # =============================================================================
@@ -1995,7 +2921,19 @@ def main(
 # =============================================================================
 
 
-def parse_args() -> argparse.Namespace:
+def parse_iso_date(value: str) -> date:
+    """Convertit une date YYYY-MM-DD passée en argument CLI."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"date invalide (YYYY-MM-DD attendu) : {value}")
+
+
+@lru_cache(maxsize=1)
+def build_arg_parser() -> argparse.ArgumentParser:
+    """
+    Construit le parser de la ligne de commande, une seule fois par processus.
+    """
     parser = argparse.ArgumentParser(
         description="Création de notices Alma à partir d'Infoscience"
     )
@@ -2011,7 +2949,9 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--since-date",
-        type=str,
+        dest="ref_date",
+        metavar="YYYY-MM-DD",
+        type=parse_iso_date,
         default=None,
         help="Date de référence YYYY-MM-DD pour Infoscience"
     )
@@ -2024,12 +2964,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--spc-rpp",
         type=int,
-        default=-1,  # pour distinguer "non fourni"
+        default=None,
         help="Nombre de résultats par page (spc.rpp). Si omis, pris depuis la config.",
     )
     parser.add_argument(
         "--env",
-        choices=["S", "P"],
+        choices=ENV_CHOICES,
         default=None,
         help="Environnement Alma: S (sandbox) ou P (prod). Si omis, pris depuis le fichier de config.",
     )
@@ -2039,9 +2979,11 @@ def parse_args() -> argparse.Namespace:
         help="Code Alma de l'institution (zone), ex. HPH, EPF... Si omis, pris depuis le fichier de config.",
     )
     parser.add_argument(
-        "--no-xsd-check",
-        action="store_true",
-        help="Désactive la validation XSD des Bib/Holding/Item.",
+        "--xsd-check",
+        dest="check_xsd",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Validation XSD des Bib/Holding/Item (--no-xsd-check pour la désactiver).",
     )
     parser.add_argument(
         "--skip-sru-check",
@@ -2054,32 +2996,68 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Nombre maximum de notices à traiter (0 = toutes).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Nombre de notices traitées en parallèle (défaut: 1 = séquentiel). "
+        "Si omis, pris depuis le fichier de config.",
+    )
     parser.add_argument(
         "--config-file",
         type=str,
         default=None,
         help="Fichier INI de configuration pour holdings/items.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--batch-file",
+        type=str,
+        default=None,
+        help="Fichier JSON Lines de jobs (un objet par ligne : spc_page, spc_rpp, env, "
+        "institution_code, since_date, max_records) exécutés dans le même processus.",
+    )
+    return parser
+
+
+def resolve_config_defaults(args: argparse.Namespace) -> argparse.Namespace:
+    """
+    Remplace les options omises (spc_rpp, env, institution_code) par les
+    valeurs du fichier de config, lu via le cache de load_config : la suite
+    du script reçoit des valeurs déjà résolues. Rien n'est journalisé ici,
+    le logging n'étant pas encore configuré : main() signale lui-même un
+    fichier de config absent ou invalide.
+    """
+    if None not in (args.spc_rpp, args.env, args.institution_code):
+        return args
+
+    general_cfg, infoscience_cfg, _, _, _ = load_config(args.config_file, None)
+    if args.spc_rpp is None:
+        args.spc_rpp = infoscience_cfg["spc_rpp"]
+    if args.env is None:
+        args.env = general_cfg["env"]
+    if args.institution_code is None:
+        args.institution_code = general_cfg["institution_code"]
+    return args
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Analyse argv (sys.argv[1:] par défaut) avec le parser partagé, puis
+    résout les valeurs par défaut issues de la config.
+    """
+    return resolve_config_defaults(build_arg_parser().parse_args(argv))
 
 
 if __name__ == "__main__":
-    args = parse_args()
-
-    ref_date = None
-    if args.since_date:
-        ref_date = datetime.strptime(args.since_date, "%Y-%m-%d").date()
-
-    main(
-        dry_run=args.dry_run,
-        use_static_url=args.use_static_url,
-        ref_date=ref_date,
-        spc_page=args.spc_page,
-        spc_rpp=args.spc_rpp,
-        env=args.env,
-        institution_code=args.institution_code,
-        check_xsd=not args.no_xsd_check,
-        max_records=args.max_records,
-        config_file=args.config_file,
-        skip_sru_check=args.skip_sru_check
-    )
+    # Les noms des options correspondent aux paramètres de main()
+    main_kwargs = vars(parse_args())
+    batch_file = main_kwargs.pop("batch_file")
+
+    if batch_file:
+        try:
+            jobs = read_batch_file(batch_file)
+        except (OSError, ValueError) as e:
+            build_arg_parser().error(f"--batch-file {batch_file} : {e}")
+        run_batch(jobs, main_kwargs)
+    else:
+        main(**main_kwargs)